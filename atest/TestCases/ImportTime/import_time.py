@@ -0,0 +1,72 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+import DataDriver
+
+ROBOT_IMPORTS = "import robot.api, robot.libraries.BuiltIn, robot.run, robot.running"
+RUNS = 10
+
+
+@lru_cache(maxsize=1)
+def get_import_times():
+    """Cumulative import time in ms per module imported by ``import DataDriver``.
+
+    Robot Framework® is imported before, because it is always loaded when DataDriver is used.
+    DataDriver is imported from a copy without bytecode cache, so the time includes compiling
+    its modules like the first import after an installation or update.
+    The fastest of ``RUNS`` imports is used for each module.
+    """
+    import_times = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        shutil.copytree(
+            Path(DataDriver.__file__).parent,
+            Path(temp_dir) / "DataDriver",
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+        env = dict(os.environ, PYTHONPATH=temp_dir)
+        for _ in range(RUNS):
+            for module, import_time in _run_import(env).items():
+                import_times[module] = min(import_time, import_times.get(module, import_time))
+    return import_times
+
+
+def _run_import(env):
+    process = subprocess.run(
+        [sys.executable, "-B", "-X", "importtime", "-c", f"{ROBOT_IMPORTS}; import DataDriver"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        is_top_level = not module[1:].startswith(" ")
+        if (
+            is_top_level and module.strip() != "DataDriver"
+        ):  # modules are listed after their imports
+            import_times.clear()
+        else:
+            import_times[module.strip()] = int(cumulative) / 1000
+    return import_times
+
+
+def import_time_of_module_should_be_within_budget(module, budget_ms):
+    import_time = get_import_times().get(module)
+    if float(budget_ms) == 0:
+        if import_time is not None:
+            raise AssertionError(f"'{module}' is imported by 'import DataDriver'.")
+        return
+    if import_time is None:
+        raise AssertionError(f"'{module}' is not imported by 'import DataDriver'.")
+    if import_time > float(budget_ms):
+        raise AssertionError(f"Import of '{module}' took {import_time} ms > {budget_ms} ms.")
@@ -0,0 +1,10 @@
+import io
+
+from DataDriver.json_reader import iter_json_array
+
+
+def parse_json_array_in_chunks(text, chunk_size):
+    """Parses ``text`` with ``iter_json_array`` reading ``chunk_size`` characters at a time."""
+    json_file = io.StringIO(text)
+    json_file.name = "json_chunks"
+    return list(iter_json_array(json_file, int(chunk_size)))
@@ -0,0 +1,89 @@
+import threading
+from pathlib import Path
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+from pabot.pabotlib import Remote
+from robot.running.model import TestCase
+
+from DataDriver import DataDriver
+from DataDriver.utils import PabotOpt
+
+
+class _CountingRequestHandler(SimpleXMLRPCRequestHandler):
+    def do_POST(self):  # noqa: N802
+        self.server.request_count += 1
+        super().do_POST()
+
+    def log_message(self, *args):
+        pass
+
+
+class _StandInPabotLib(SimpleXMLRPCServer):
+    """Answers ``run_keyword`` like PabotLib and records the queued items."""
+
+    def __init__(self, multicall):
+        super().__init__(
+            ("127.0.0.1", 0), _CountingRequestHandler, allow_none=True, logRequests=False
+        )
+        self.request_count = 0
+        self.queue = []
+        self.register_function(self.run_keyword, "run_keyword")
+        if multicall:
+            self.register_introspection_functions()
+            self.register_multicall_functions()
+
+    def run_keyword(self, name, args, kwargs=None):
+        if name != "add_suite_to_execution_queue":
+            return {"status": "FAIL", "error": f"Unexpected keyword '{name}'"}
+        suite_name, variables = args
+        self.queue.append(f"{suite_name}:{variables[0]}")
+        return {"status": "PASS"}
+
+
+def fill_stand_in_pabot_queue(test_count, multicall):
+    """Adds ``test_count`` atomic tests to a stand-in PabotLib.
+
+    Returns the number of queued items and the number of XML-RPC requests.
+    """
+    server = _StandInPabotLib(multicall)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"127.0.0.1:{server.server_address[1]}"
+        data_driver = DataDriver(optimize_pabot=PabotOpt.Atomic)
+        data_driver.suite_name = "Queue Suite"
+        test_list = [TestCase(name=f"test {index}") for index in range(int(test_count))]
+        data_driver._create_pabot_queue(2, Remote(url), test_list, url)
+    finally:
+        server.shutdown()
+        server.server_close()
+    expected = [f"Queue Suite:DYNAMICTEST:Queue Suite.{test.name}" for test in test_list]
+    if server.queue != expected:
+        raise AssertionError("Pabot queue does not contain the tests in their order.")
+    return len(server.queue), server.request_count
+
+
+def fill_stand_in_pabot_queue_from_file(data_file, cache_dir, optimize_pabot, suite_name):
+    """Fills a stand-in PabotLib with the tests of ``data_file`` like the first pabot process.
+
+    Returns the queued variables in the ``NAME:value`` format of ``robot --variable``.
+    """
+    server = _StandInPabotLib(multicall=False)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"127.0.0.1:{server.server_address[1]}"
+        data_driver = DataDriver(
+            file=str(Path(data_file).resolve()),
+            cache_dir=cache_dir,
+            optimize_pabot=PabotOpt[optimize_pabot],
+        )
+        data_driver.suite_name = suite_name
+        data_driver.data_reader = data_driver._data_reader()
+        data_driver.data_table = data_driver.data_reader.get_data_from_source()
+        test_list = [TestCase(name=data.test_case_name) for data in data_driver.data_table]
+        data_driver._create_pabot_queue(2, Remote(url), test_list, url)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return [queue_item[len(suite_name) + 1 :] for queue_item in server.queue]
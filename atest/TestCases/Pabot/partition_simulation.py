@@ -0,0 +1,52 @@
+import heapq
+import random
+
+from DataDriver.pabot_queue import guided_partition_test_list
+from DataDriver.utils import (
+    binary_partition_test_list,
+    equally_partition_test_list,
+)
+
+CHUNK_OVERHEAD = 0.5
+PARTITIONERS = {
+    "Equal": equally_partition_test_list,
+    "Binary": binary_partition_test_list,
+    "Guided": guided_partition_test_list,
+}
+
+
+def synthetic_durations(distribution, count, seed=42):
+    rnd = random.Random(int(seed))
+    count = int(count)
+    if distribution == "constant":
+        return [1.0] * count
+    if distribution == "uniform":
+        return [rnd.uniform(0.1, 2.0) for _ in range(count)]
+    if distribution == "exponential":
+        return [rnd.expovariate(1.0) for _ in range(count)]
+    if distribution == "heavy_tail":
+        return [rnd.paretovariate(1.5) for _ in range(count)]
+    if distribution == "slow_end":
+        return [1.0 if i < count * 0.8 else 5.0 for i in range(count)]
+    raise ValueError(f"Unknown distribution {distribution}")
+
+
+def get_makespan(partitioner, distribution, test_count, process_count):
+    """Simulates the pabot queue: each group starts on the process that gets free first."""
+    process_count = int(process_count)
+    durations = synthetic_durations(distribution, test_count)
+    chunks = PARTITIONERS[partitioner](durations, process_count)
+    processes = [0.0] * process_count
+    for chunk in chunks:
+        if not chunk:
+            continue
+        free_at = heapq.heappop(processes)
+        heapq.heappush(processes, free_at + CHUNK_OVERHEAD + sum(chunk))
+    return max(processes)
+
+
+def get_makespan_ratio(partitioner, distribution, test_count, process_count):
+    """Makespan relative to the lower bound ``max(sum / processes, longest test)``."""
+    durations = synthetic_durations(distribution, test_count)
+    lower_bound = max(sum(durations) / int(process_count), max(durations))
+    return get_makespan(partitioner, distribution, test_count, process_count) / lower_bound
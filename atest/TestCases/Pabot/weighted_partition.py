@@ -0,0 +1,14 @@
+from robot.running.model import TestCase, TestSuite
+
+from DataDriver import DataDriver
+from DataDriver.utils import PabotOpt
+
+
+def get_test_durations(durations_file, *test_names):
+    """Durations that ``optimize_pabot=Weighted`` uses for the tests of suite ``Durations.Weighted``."""
+    data_driver = DataDriver(optimize_pabot=PabotOpt.Weighted, pabot_durations=durations_file)
+    suite = TestSuite(name="Weighted", source=__file__)
+    data_driver.template_test = suite.tests.create(name="template")
+    data_driver.suite_name = "Durations.Weighted"
+    data_driver.suite_source = __file__
+    return data_driver._get_test_durations([TestCase(name=name) for name in test_names])
@@ -0,0 +1,5 @@
+from pathlib import Path
+
+from DataDriver.utils import file_content_hash
+
+DATADRIVER_ROWS = f"{file_content_hash(Path(__file__).parent / 'row_selection.csv')}:1-2,4"
@@ -0,0 +1,4 @@
+"""Benchmarks for the parse and generate phases of DataDriver.
+
+Run ``python -m benchmarks --help`` from the repository root.
+"""
@@ -0,0 +1,165 @@
+"""Generators of synthetic data sources and suites for the benchmarks."""
+
+import json
+from pathlib import Path
+from typing import List
+
+FORMATS = ("csv", "xlsx", "json", "glob")
+KINDS = ("plain", "typed")
+
+
+def get_argument_columns(argument_count: int, kind: str) -> List[str]:
+    columns = [f"${{arg_{index}}}" for index in range(argument_count)]
+    if kind == "typed":
+        columns.extend(["@{list}", "&{dict}", "e{literal}", "${nested.key}"])
+    return columns
+
+
+def get_cells(row: int, columns: List[str]) -> List[str]:
+    cells = []
+    for column in columns:
+        if column.startswith("@"):
+            cells.append(f"a{row},b{row},c{row}")
+        elif column.startswith("&"):
+            cells.append(f"first=a{row},second=b{row}")
+        elif column.startswith("e"):
+            cells.append(f"[{row}, {{'row': {row}}}]")
+        else:
+            cells.append(f"value {row} of {column[2:-1]}")
+    return cells
+
+
+def get_tags(row: int) -> str:
+    return f"bench,mod_{row % 10}"
+
+
+def write_data_source(folder: Path, data_format: str, rows: int, argument_count: int, kind: str):
+    """Writes the data source once and returns the value for the ``file`` option."""
+    name = get_case_name(data_format, rows, argument_count, kind)
+    if data_format == "glob":
+        target = folder / name
+        if not target.exists():
+            target.mkdir(parents=True)
+            for row in range(rows):
+                (target / f"test_{row}.txt").write_text(str(row), encoding="utf-8")
+        return f"{target.as_posix()}/*.txt"
+    target = folder / f"{name}.{data_format}"
+    if target.exists():
+        return target.as_posix()
+    folder.mkdir(parents=True, exist_ok=True)
+    columns = get_argument_columns(argument_count, kind)
+    if data_format == "csv":
+        _write_csv(target, rows, columns)
+    elif data_format == "xlsx":
+        _write_xlsx(target, rows, columns)
+    elif data_format == "json":
+        _write_json(target, rows, columns)
+    else:
+        raise ValueError(f"Unknown format {data_format}")
+    return target.as_posix()
+
+
+def _header(columns: List[str]) -> List[str]:
+    return ["*** Test Cases ***", *columns, "[Tags]", "[Documentation]"]
+
+
+def _row(row: int, columns: List[str]) -> List[str]:
+    return [f"test {row}", *get_cells(row, columns), get_tags(row), f"Row {row}"]
+
+
+def _write_csv(target: Path, rows: int, columns: List[str]):
+    with target.open("w", encoding="utf-8", newline="") as file:
+        file.write(";".join(_header(columns)) + "\n")
+        for row in range(rows):
+            file.write(";".join(_row(row, columns)) + "\n")
+
+
+def _write_xlsx(target: Path, rows: int, columns: List[str]):
+    from openpyxl import Workbook  # noqa: PLC0415
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(_header(columns))
+    for row in range(rows):
+        sheet.append(_row(row, columns))
+    workbook.save(target)
+
+
+def _write_json(target: Path, rows: int, columns: List[str]):
+    test_cases = []
+    for row in range(rows):
+        arguments = {}
+        for column, cell in zip(columns, get_cells(row, columns)):
+            if column.startswith("@"):
+                arguments[f"${{{column[2:-1]}}}"] = cell.split(",")
+            elif column.startswith("&"):
+                arguments[f"${{{column[2:-1]}}}"] = dict(
+                    item.split("=") for item in cell.split(",")
+                )
+            elif column.startswith("e"):
+                arguments[f"${{{column[2:-1]}}}"] = [row, {"row": row}]
+            elif "." in column:
+                arguments["${nested}"] = {"key": cell}
+            else:
+                arguments[column] = cell
+        test_cases.append(
+            {
+                "test_case_name": f"test {row}",
+                "arguments": arguments,
+                "tags": get_tags(row).split(","),
+                "documentation": f"Row {row}",
+            }
+        )
+    with target.open("w", encoding="utf-8") as file:
+        json.dump(test_cases, file)
+
+
+def get_case_name(data_format: str, rows: int, argument_count: int, kind: str) -> str:
+    return f"{data_format}_{kind}_{argument_count}_{rows}"
+
+
+def write_suite(
+    folder: Path,
+    name: str,
+    data_file: str,
+    *,
+    data_format: str,
+    argument_count: int,
+    kind: str,
+    streaming: bool = False,
+):
+    if data_format == "glob":
+        arguments = ["${file_name}"]
+    else:
+        arguments = sorted(
+            {
+                f"${{{column[2:-1].split('.')[0]}}}"
+                for column in get_argument_columns(argument_count, kind)
+            }
+        )
+    options = [f"file={data_file}", "encoding=utf_8"]
+    if data_format == "glob":
+        options.append("reader_class=glob_reader")
+    if streaming:
+        options.append("streaming=True")
+    suite = folder / f"{name}{'_streaming' if streaming else ''}.robot"
+    suite.write_text(
+        "\n".join(
+            [
+                "*** Settings ***",
+                "Library    benchmarks.timed_datadriver.TimedDataDriver    " + "    ".join(options),
+                "Test Template    Bench Keyword",
+                "",
+                "*** Test Cases ***",
+                "Template    default",
+                "",
+                "*** Keywords ***",
+                "Bench Keyword",
+                "    [Arguments]    " + "    ".join(arguments),
+                "    No Operation",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    return suite
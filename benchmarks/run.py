@@ -0,0 +1,148 @@
+"""Command line interface of the DataDriver benchmarks.
+
+Each case runs in its own Robot Framework process, so peak RSS values are not influenced
+by other cases. Results are written as JSON and can be compared to an earlier result file.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import robot
+
+from .data import FORMATS, KINDS, get_case_name, write_data_source, write_suite
+
+ROOT = Path(__file__).resolve().parent.parent
+PHASES = ("parse", "filter_and_generate", "start_suite")
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--rows", default="1000,10000", help="comma separated row counts")
+    parser.add_argument("--formats", default=",".join(FORMATS), help="csv, xlsx, json, glob")
+    parser.add_argument("--arguments", default="5", help="comma separated argument counts")
+    parser.add_argument("--kinds", default=",".join(KINDS), help="plain and/or typed columns")
+    parser.add_argument("--streaming", action="store_true", help="use streaming=True")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per case, fastest is kept")
+    parser.add_argument("--work-dir", default=str(Path(tempfile.gettempdir()) / "dd_benchmarks"))
+    parser.add_argument("--output", help="JSON file to write the results to")
+    parser.add_argument("--compare", help="JSON result file of an earlier run")
+    return parser.parse_args(argv)
+
+
+def _split(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def run_case(suite: Path, work_dir: Path) -> Dict:
+    result_file = work_dir / "result.json"
+    result_file.unlink(missing_ok=True)
+    env = dict(os.environ)
+    env["DATADRIVER_BENCHMARK_RESULT"] = str(result_file)
+    env["PYTHONPATH"] = os.pathsep.join([str(ROOT), str(ROOT / "src"), env.get("PYTHONPATH", "")])
+    command = [sys.executable, "-m", "robot", "--output", "NONE", "--log", "NONE"]
+    command += ["--report", "NONE", "--console", "none", str(suite)]
+    subprocess.run(command, env=env, check=False)
+    if not result_file.is_file():
+        raise RuntimeError(f"Benchmark suite '{suite}' did not write a result.")
+    return json.loads(result_file.read_text(encoding="utf-8"))
+
+
+def run(args) -> Dict:
+    work_dir = Path(args.work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    cases = []
+    for data_format in _split(args.formats):
+        for kind in _split(args.kinds) if data_format != "glob" else ["plain"]:
+            argument_counts = [int(count) for count in _split(args.arguments)]
+            for argument_count in argument_counts if data_format != "glob" else [1]:
+                for rows in [int(count) for count in _split(args.rows)]:
+                    name = get_case_name(data_format, rows, argument_count, kind)
+                    data_file = write_data_source(
+                        work_dir / "data", data_format, rows, argument_count, kind
+                    )
+                    suite = write_suite(
+                        work_dir,
+                        name,
+                        data_file,
+                        data_format=data_format,
+                        argument_count=argument_count,
+                        kind=kind,
+                        streaming=args.streaming,
+                    )
+                    runs = [run_case(suite, work_dir) for _ in range(max(1, args.repeat))]
+                    result = min(runs, key=lambda run_result: run_result["start_suite"])
+                    result.update(
+                        name=name,
+                        format=data_format,
+                        kind=kind,
+                        arguments=argument_count,
+                        rows=rows,
+                        streaming=args.streaming,
+                    )
+                    cases.append(result)
+                    _write_line(_format_result(result))
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "datadriver": _get_datadriver_version(),
+        "robotframework": robot.__version__ if hasattr(robot, "__version__") else None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": cases,
+    }
+
+
+def _get_datadriver_version():
+    from DataDriver.DataDriver import __version__  # noqa: PLC0415
+
+    return __version__
+
+
+def _format_result(result: Dict) -> str:
+    rss = result.get("peak_rss_mb")
+    return (
+        f"{result['name']:<28} tests={result['tests']:<8} "
+        + " ".join(f"{phase}={result[phase]:.3f}s" for phase in PHASES)
+        + (f" peak_rss={rss:.0f}MB" if rss is not None else "")
+    )
+
+
+def compare(results: Dict, baseline: Dict) -> List[str]:
+    baseline_cases = {
+        (case["name"], case.get("streaming", False)): case for case in baseline["cases"]
+    }
+    lines = [f"Compared to DataDriver {baseline.get('datadriver')} from {baseline.get('created')}"]
+    for case in results["cases"]:
+        old = baseline_cases.get((case["name"], case.get("streaming", False)))
+        if old is None:
+            continue
+        changes = []
+        for phase in PHASES:
+            if old[phase]:
+                changes.append(f"{phase} {(case[phase] / old[phase] - 1) * 100:+.1f}%")
+        lines.append(f"{case['name']:<28} " + " ".join(changes))
+    return lines
+
+
+def _write_line(line: str):
+    sys.stdout.write(f"{line}\n")
+    sys.stdout.flush()
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+    results = run(args)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        for line in compare(results, baseline):
+            _write_line(line)
@@ -0,0 +1,59 @@
+"""DataDriver that measures its phases and writes them as JSON.
+
+The generated tests are removed after they have been measured, so they are not executed.
+The result file is given by the environment variable ``DATADRIVER_BENCHMARK_RESULT``.
+"""
+
+import json
+import os
+import sys
+import time
+
+from DataDriver import DataDriver
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore
+
+
+def get_peak_rss_mb():
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss / 1024 / 1024 if sys.platform == "darwin" else peak_rss / 1024
+
+
+class TimedDataDriver(DataDriver):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timings = {"parse": 0.0, "filter_and_generate": 0.0}
+
+    def _create_data_table(self):
+        start_time = time.perf_counter()
+        super()._create_data_table()
+        self.timings["parse"] += time.perf_counter() - start_time
+
+    def _get_filtered_test_list(self):
+        start_time = time.perf_counter()
+        test_list = super()._get_filtered_test_list()
+        self.timings["filter_and_generate"] += time.perf_counter() - start_time
+        return test_list
+
+    def _start_suite(self, suite, *_):
+        rss_before = get_peak_rss_mb()
+        start_time = time.perf_counter()
+        super()._start_suite(suite, *_)
+        start_suite = time.perf_counter() - start_time
+        result = {
+            **self.timings,
+            "start_suite": start_suite,
+            "tests": len(suite.tests),
+            "peak_rss_mb": get_peak_rss_mb(),
+            "rss_before_mb": rss_before,
+        }
+        suite.tests.clear()
+        result_file = os.environ.get("DATADRIVER_BENCHMARK_RESULT")
+        if result_file:
+            with open(result_file, "w", encoding="utf-8") as file:  # noqa: PTH123
+                json.dump(result, file)
@@ -35,6 +35,10 @@ setup(
         "Framework :: Robot Framework",
     ],
     install_requires=["robotframework >= 4.0.2, < 8.0", "docutils", "Pygments"],
-    extras_require={"xls": ["pandas", "xlrd >= 1.2.0", "openpyxl"]},
+    extras_require={
+        "xls": ["pandas", "xlrd >= 1.2.0", "openpyxl"],
+        "xlsx": ["openpyxl"],
+        "arrow": ["pyarrow"],
+    },
     python_requires=">=3.8.0",
 )
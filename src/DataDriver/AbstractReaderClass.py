@@ -12,20 +12,60 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import ast
+import re
 from abc import ABC, abstractmethod
-from re import compile
-from typing import List
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set
 
 from robot.libraries.BuiltIn import BuiltIn  # type: ignore
 from robot.utils import DotDict  # type: ignore
 
-from .ReaderConfig import ReaderConfig, TestCaseData
+from .ReaderConfig import ReaderConfig, TestCaseData, shared_argument_names
 from .search import search_variable
+from .utils import TagFilter
 
 built_in = BuiltIn()
 
+REPLACED_VARIABLES_CACHE_SIZE = 10000
+LITERAL_EVAL_CACHE_SIZE = 1024
+ROW_BLOCK_SIZE = 1000
+
+
+@lru_cache(maxsize=LITERAL_EVAL_CACHE_SIZE)
+def compile_literal(expression: str):
+    """Returns the compiled code of a pure Python literal or None for any other expression."""
+    try:
+        node = ast.parse(expression.strip(), mode="eval")
+        ast.literal_eval(node)
+    except (SyntaxError, ValueError, TypeError, MemoryError, RecursionError):
+        return None
+    return compile(node, "<literal>", "eval")
+
+
+class ArgumentColumn:
+    """Precompiled conversion plan of one argument column of the data table header."""
+
+    __slots__ = ("base", "column_id", "is_dict", "is_list", "is_literal_eval", "items", "name")
+
+    def __init__(self, column_id: int, variable_match, is_literal_eval: bool = False):
+        base = variable_match.base
+        items = list(variable_match.items)
+        if "." in base:  # is dot notated advanced variable dictionary ${dict.key.subkey}
+            base, *items = base.split(".")
+        self.column_id = column_id
+        self.name = f"${{{base}}}"
+        self.base = base
+        self.items = items
+        self.is_literal_eval = is_literal_eval
+        self.is_list = variable_match.is_list_variable
+        self.is_dict = variable_match.is_dict_variable
+
 
 class AbstractReaderClass(ABC):
+    supports_file_patterns = False  # True if ``file`` may be a glob pattern of many data files
+
     def __init__(self, reader_config: ReaderConfig):
         self.reader_config = reader_config
         self.file = reader_config.file
@@ -49,20 +89,75 @@ class AbstractReaderClass(ABC):
         self.tags_column_id = None
         self.documentation_column_id = None
         self.header: List = []
+        self.argument_columns: Optional[List[ArgumentColumn]] = None
+        self._replaced_variables: Dict[str, str] = {}
+        self.uses_variables = False  # True if a value depends on variables or evaluated expressions
         self.data_table: List[TestCaseData] = []
+        self.tag_filter: Optional[TagFilter] = None
+        self.selected_test_names: Optional[Set[str]] = None
+        self.pruned_tags: Set[str] = set()
+        self.pruned_rows = 0
+        self.source_tags: List[str] = []
 
         self.TESTCASE_TABLE_NAME = ReaderConfig.TEST_CASE_TABLE_NAME
-        self.TEST_CASE_TABLE_PATTERN = compile(r"(?i)^(\*+\s*test ?cases?[\s*].*)")
-        self.TASK_TABLE_PATTERN = compile(r"(?i)^(\*+\s*tasks?[\s*].*)")
-        self.VARIABLE_PATTERN = compile(r"([$@&e]\{)(.*?)(\})")
-        self.TAGS_PATTERN = compile(r"(?i)(\[)(tags)(\])")
-        self.DOCUMENTATION_PATTERN = compile(r"(?i)(\[)(documentation)(\])")
-        self.LIT_EVAL_PATTERN = compile(r"e\{(.+)\}")
+        self.TEST_CASE_TABLE_PATTERN = re.compile(r"(?i)^(\*+\s*test ?cases?[\s*].*)")
+        self.TASK_TABLE_PATTERN = re.compile(r"(?i)^(\*+\s*tasks?[\s*].*)")
+        self.VARIABLE_PATTERN = re.compile(r"([$@&e]\{)(.*?)(\})")
+        self.TAGS_PATTERN = re.compile(r"(?i)(\[)(tags)(\])")
+        self.DOCUMENTATION_PATTERN = re.compile(r"(?i)(\[)(documentation)(\])")
+        self.LIT_EVAL_PATTERN = re.compile(r"e\{(.+)\}")
 
     @abstractmethod
     def get_data_from_source(self) -> List[TestCaseData]:
         """This method must be implemented and return self.data_table ( a List[TestCaseData] )."""
 
+    def iter_data_from_source(self) -> Iterator[TestCaseData]:
+        """Yields the TestCaseData one by one. Used by DataDriver if ``streaming=True``.
+
+        Readers that are able to read their source row by row should override this method.
+        By default it just iterates over the result of ``get_data_from_source``."""
+        yield from self.get_data_from_source()
+
+    def set_row_filter(
+        self,
+        tag_filter: Optional[TagFilter] = None,
+        selected_test_names: Optional[Set[str]] = None,
+    ):
+        """Sets the filters DataDriver applies to the read test cases anyway.
+
+        Rows which are rejected by ``tag_filter`` or whose test case name is not in
+        ``selected_test_names`` are skipped before their arguments are converted.
+        Rows without a test case name are never skipped by name.
+        The tags of skipped rows are collected in ``pruned_tags``."""
+        self.tag_filter = tag_filter if tag_filter is not None and tag_filter.is_active else None
+        self.selected_test_names = selected_test_names
+
+    def reads_indexed_rows(self) -> bool:
+        """Returns True if the reader reads just the rows selected by ``set_row_filter``
+        from an index instead of parsing the whole source.
+
+        DataDriver does not store the data table in the parse cache in that case."""
+        return False
+
+    def _is_row_selected(self, test_case_name, tags) -> bool:
+        if (self.tag_filter is not None and not self.tag_filter.match(tags)) or (
+            self.selected_test_names is not None
+            and test_case_name
+            and str(test_case_name) not in self.selected_test_names
+        ):
+            self.pruned_tags.update(tags or [])
+            self.pruned_rows += 1
+            return False
+        return True
+
+    def _is_table_row_selected(self, row) -> bool:
+        if self.tag_filter is None and self.selected_test_names is None:
+            return True
+        test_case_name = (
+            row[self.test_case_column_id] if self.test_case_column_id is not None else ""
+        )
+        return self._is_row_selected(test_case_name, self._get_tags(row))
+
     def _is_test_case_header(self, header_string: str):
         return self.TEST_CASE_TABLE_PATTERN.fullmatch(
             header_string
@@ -79,6 +174,11 @@ class AbstractReaderClass(ABC):
 
     def _analyse_header(self, header_cells):
         self.header = header_cells
+        self.argument_columns = None
+        self.test_case_column_id = None
+        self.arguments_column_ids = []
+        self.tags_column_id = None
+        self.documentation_column_id = None
         for cell_index, cell in enumerate(self.header):
             naked_cell = cell.strip()
             if self._is_test_case_header(naked_cell):
@@ -90,58 +190,194 @@ class AbstractReaderClass(ABC):
             elif self._is_documentation(naked_cell):
                 self.documentation_column_id = cell_index
 
-    def _read_data_from_table(self, row):
-        test_case_name = (
-            row[self.test_case_column_id] if self.test_case_column_id is not None else ""
-        )
-        arguments = {}
+    def _compile_argument_columns(self) -> List[ArgumentColumn]:
+        argument_columns = []
         for arguments_column_id in self.arguments_column_ids:
             variable_string = str(self.header[arguments_column_id]).strip()
-            variable_value = row[arguments_column_id]
-            if self.LIT_EVAL_PATTERN.fullmatch(variable_string):
+            is_literal_eval = bool(self.LIT_EVAL_PATTERN.fullmatch(variable_string))
+            if is_literal_eval:
                 variable_string = f"${variable_string[1:]}"
-                variable_value = built_in.replace_variables(variable_value)
-                variable_value = built_in.evaluate(variable_value)
             variable_match = search_variable(variable_string)
             if variable_match.is_variable:
-                arguments.update(
-                    self._get_arguments_entry(variable_match, variable_value, arguments)
+                argument_columns.append(
+                    ArgumentColumn(arguments_column_id, variable_match, is_literal_eval)
                 )
+        return argument_columns
+
+    def _read_data_from_table(self, row):
+        if self._is_table_row_selected(row):
+            self.data_table.append(self._create_test_case_data(row))
+
+    def _iter_test_case_data_in_blocks(
+        self, rows: Iterable[Sequence], first_row_number: int = 1
+    ) -> Iterator[TestCaseData]:
+        """Selects and converts the rows block by block and yields the ``TestCaseData``.
+
+        ``first_row_number`` is the number of the first row, that is set as ``row``
+        to the exception, if a row can not be converted.
+        """
+        rows = iter(rows)
+        block_start = first_row_number
+        while True:
+            block = list(islice(rows, ROW_BLOCK_SIZE))
+            if not block:
+                return
+            selected_rows = []
+            selected_row_numbers = []
+            for row_number, row in enumerate(block, block_start):
+                try:
+                    if self._is_table_row_selected(row):
+                        selected_rows.append(row)
+                        selected_row_numbers.append(row_number)
+                except Exception as e:
+                    e.row = row_number
+                    raise e
+            try:
+                test_case_data = self._create_test_case_data_block(selected_rows)
+            except Exception:
+                self._raise_row_error(selected_rows, selected_row_numbers)
+                raise
+            yield from test_case_data
+            block_start += len(block)
+
+    def _raise_row_error(self, rows, row_numbers):
+        """Converts the rows one by one to find the row number of a conversion error."""
+        for row_number, row in zip(row_numbers, rows):
+            try:
+                self._create_test_case_data(row)
+            except Exception as e:
+                e.row = row_number
+                raise e
+
+    def _create_test_case_data_block(self, rows: Sequence[Sequence]) -> List[TestCaseData]:
+        """Converts a block of rows column by column and returns their ``TestCaseData``.
+
+        Results are the same as calling ``_create_test_case_data`` for each row.
+        """
+        if not rows:
+            return []
+        if self.argument_columns is None:
+            self.argument_columns = self._compile_argument_columns()
+        test_case_names = self._get_column(rows, self.test_case_column_id, "")
+        documentations = (
+            self._get_column(rows, self.documentation_column_id, None)
+            if self.documentation_column_id
+            else [None] * len(rows)
+        )
         tags = (
-            [t.strip() for t in row[self.tags_column_id].split(",")]
-            if self.tags_column_id
-            else None
+            self._get_tags_column(rows)
+            if self.tags_column_id or self.source_tags
+            else [None] * len(rows)
         )
-        documentation = row[self.documentation_column_id] if self.documentation_column_id else None
+        columns = [
+            self._convert_argument_column(
+                argument_column, [row[argument_column.column_id] for row in rows]
+            )
+            for argument_column in self.argument_columns
+        ]
+        names = shared_argument_names(
+            tuple(argument_column.name for argument_column in self.argument_columns)
+        )
+        if len(set(names)) < len(names) or any(column.items for column in self.argument_columns):
+            return [
+                TestCaseData(
+                    test_case_names[index],
+                    self._assemble_arguments([column[index] for column in columns]),
+                    tags[index],
+                    documentations[index],
+                )
+                for index in range(len(rows))
+            ]
+        return [
+            TestCaseData.from_values(name, names, values, row_tags, documentation)
+            for name, values, row_tags, documentation in zip(
+                test_case_names,
+                zip(*columns) if columns else ((),) * len(rows),
+                tags,
+                documentations,
+            )
+        ]
 
-        self.data_table.append(TestCaseData(test_case_name, arguments, tags, documentation))
+    def _get_tags_column(self, rows) -> List[List[str]]:
+        """Splits equal tag cells only once. Each row still gets its own list of tags."""
+        if not self.tags_column_id:
+            return [self.source_tags.copy() for _ in rows]
+        split_tags: Dict[str, List[str]] = {}
+        tags = []
+        for row in rows:
+            cell = row[self.tags_column_id]
+            if cell not in split_tags:
+                split_tags[cell] = [t.strip() for t in cell.split(",")] + self.source_tags
+            tags.append(split_tags[cell].copy())
+        return tags
 
-    def _get_arguments_entry(self, variable_match, variable_value, arguments):
-        base = variable_match.base
-        items = variable_match.items
-        if variable_match.is_list_variable:
-            if not variable_value:
-                variable_value = []
-            else:
-                variable_value = [
-                    built_in.replace_variables(var)
-                    for var in (str(variable_value).split(self.list_separator))
+    @staticmethod
+    def _get_column(rows, column_id, default):
+        if column_id is None:
+            return [default] * len(rows)
+        return [row[column_id] for row in rows]
+
+    def _convert_argument_column(self, argument_column: ArgumentColumn, values: List) -> List:
+        """Converts the values of one argument column.
+
+        Dictionary items like ``${dict.key}`` are assigned afterwards by ``_assemble_arguments``.
+        Single rows are converted as a block of one row, so readers only override this method."""
+        if argument_column.is_literal_eval:
+            values = [self._evaluate(self._replace_variables(value)) for value in values]
+        if argument_column.is_list:
+            separator = self.list_separator
+            if any(self._may_contain_variables(str(value)) for value in values):
+                return [
+                    (
+                        [self._replace_variables(var) for var in str(value).split(separator)]
+                        if value
+                        else []
+                    )
+                    for value in values
                 ]
-        elif variable_match.is_dict_variable:
-            variable_value = built_in.create_dictionary(
-                *(str(variable_value).split(self.list_separator))
+            return [str(value).split(separator) if value else [] for value in values]
+        if argument_column.is_dict:
+            separator = self.list_separator
+            return [self._create_dictionary(str(value).split(separator)) for value in values]
+        return values
+
+    def _assemble_arguments(self, values) -> Dict:
+        arguments: Dict = {}
+        for argument_column, value in zip(self.argument_columns, values):
+            arguments[argument_column.name] = (
+                self._update_argument_dict(
+                    arguments, argument_column.base, argument_column.items, value
+                )
+                if argument_column.items
+                else value
             )
-        if "." in base:  # is dot notated advanced variable dictionary ${dict.key.subkey}
-            base, *items = base.split(".")
-            variable_value = self._update_argument_dict(arguments, base, items, variable_value)
-        elif items:  # is dictionary syntax ${dict}[key][subkey]
-            variable_value = self._update_argument_dict(arguments, base, items, variable_value)
+        return arguments
+
+    def _create_test_case_data(self, row) -> TestCaseData:
+        test_case_name = (
+            row[self.test_case_column_id] if self.test_case_column_id is not None else ""
+        )
+        if self.argument_columns is None:
+            self.argument_columns = self._compile_argument_columns()
+        arguments = self._assemble_arguments(
+            [
+                self._convert_argument_column(argument_column, [row[argument_column.column_id]])[0]
+                for argument_column in self.argument_columns
+            ]
+        )
+        tags = self._get_tags(row)
+        documentation = row[self.documentation_column_id] if self.documentation_column_id else None
 
-        return {self._as_var(base): variable_value}
+        return TestCaseData(test_case_name, arguments, tags, documentation)
+
+    def _get_tags(self, row) -> Optional[List[str]]:
+        if not self.tags_column_id:
+            return self.source_tags.copy() if self.source_tags else None
+        return [t.strip() for t in row[self.tags_column_id].split(",")] + self.source_tags
 
     def _update_argument_dict(self, arguments, base, items, value):
         if self._as_var(base) not in arguments:
-            arguments[self._as_var(base)] = built_in.create_dictionary()
+            arguments[self._as_var(base)] = DotDict()
         argument = arguments[self._as_var(base)]
 
         if isinstance(argument, DotDict):
@@ -149,11 +385,56 @@ class AbstractReaderClass(ABC):
             for key in items:
                 if key != items[-1]:
                     if key not in selected_key or not isinstance(selected_key[key], DotDict):
-                        selected_key[key] = built_in.create_dictionary()
+                        selected_key[key] = DotDict()
                     selected_key = selected_key[key]
-            selected_key[items[-1]] = built_in.replace_variables(value)
+            selected_key[items[-1]] = self._replace_variables(value)
             return argument
         raise TypeError(f"{self._as_var(base)} is defined with a wrong type. Not defaultdict.")
 
+    def _replace_variables(self, value):
+        """Replaces variables like ``BuiltIn.replace_variables`` but skips plain values.
+
+        Variables always contain ``{`` and escapes always contain ``\\``,
+        so values without them are returned unchanged without calling Robot Framework®.
+        Replaced strings are cached, unless they contain inline Python evaluation.
+        """
+        if not self._may_contain_variables(value):
+            return value
+        if "{" in value:
+            self.uses_variables = True
+        if value in self._replaced_variables:
+            return self._replaced_variables[value]
+        replaced_value = built_in.replace_variables(value)
+        if (
+            isinstance(replaced_value, str)
+            and "${{" not in value
+            and len(self._replaced_variables) < REPLACED_VARIABLES_CACHE_SIZE
+        ):
+            self._replaced_variables[value] = replaced_value
+        return replaced_value
+
+    def _evaluate(self, expression):
+        """Evaluates pure literals from compiled code and everything else with ``BuiltIn.evaluate``.
+
+        The compiled code creates new objects on each call,
+        so rows do not share mutable lists or dictionaries.
+        """
+        if isinstance(expression, str):
+            code = compile_literal(expression)
+            if code is not None:
+                return eval(code, {"__builtins__": {}})
+        self.uses_variables = True
+        return built_in.evaluate(expression)
+
+    @staticmethod
+    def _may_contain_variables(value):
+        return isinstance(value, str) and ("{" in value or "\\" in value)
+
+    def _create_dictionary(self, items):
+        if any(self._may_contain_variables(item) or "=" not in item for item in items):
+            self.uses_variables = self.uses_variables or any("{" in item for item in items)
+            return built_in.create_dictionary(*items)
+        return DotDict(item.split("=", 1) for item in items)
+
     def _as_var(self, base):
         return f"${{{base}}}"
@@ -15,10 +15,12 @@
 import importlib
 import inspect
 import re
+import time
 import traceback
+from collections import defaultdict
 from glob import glob
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union  # type: ignore
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union  # type: ignore
 
 from robot.api.logger import console  # type: ignore
 from robot.libraries.BuiltIn import BuiltIn  # type: ignore
@@ -34,23 +36,34 @@ from .argument_utils import robot_options  # type: ignore
 from .ReaderConfig import (
     ReaderConfig,  # type: ignore
     TestCaseData,  # type: ignore
+    TestCaseDataDict,  # type: ignore
+    TestCaseDataList,  # type: ignore
 )
 from .search import search_variable  # type: ignore
+from .stats import SuiteStats, append_stats, format_stats  # type: ignore
 from .utils import (  # type: ignore
     Encodings,
     PabotOpt,
+    TagFilter,
     TagHandling,
     binary_partition_test_list,
     debug,
+    decode_row_ranges,
     equally_partition_test_list,
     error,
+    file_content_hash,
     get_filter_dynamic_test_names,
+    get_pabot_queue_variable,
     get_variable_value,
+    is_file_pattern,
     is_pabot_dry_run,
     is_same_keyword,
     warn,
 )
 
+if TYPE_CHECKING:
+    from .parse_cache import ParseCache  # type: ignore
+
 __version__ = "1.11.1"
 
 
@@ -102,6 +115,19 @@ class DataDriver:
 
     ``pip install --upgrade robotframework-datadriver[XLS]``
 
+    If you only need ``xlsx`` files, openpyxl is sufficient and pandas is not required.
+
+    ``pip install --upgrade robotframework-datadriver[XLSX]``
+
+
+    Parquet and Arrow Support
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    For ``parquet``, ``arrow`` and ``feather`` files and for ``csv_engine=fast`` pyarrow is required.
+    Just add [ARROW] to your installation.
+
+    ``pip install --upgrade robotframework-datadriver[ARROW]``
+
 
     Python 2
     ~~~~~~~~
@@ -132,6 +158,7 @@ class DataDriver:
     -  `Selection of Test Cases to Execute`_
     -  `Configure DataDriver by Pre-Run Keyword`_
     -  `Pabot and DataDriver`_
+    -  `Large Data Sources`_
 
 
     What DataDriver Does
@@ -567,6 +594,10 @@ class DataDriver:
 
     ``${DataDriver_DATA_LIST}[2][arguments][\${password}]`` would result in ``mode`` .
 
+    The dictionary of a test case is created when it is read the first time.
+    Until then DataDriver keeps the test case data in a more compact form,
+    so big data tables do not need memory for a dictionary per test case.
+
 
 
     &{DataDriver_DATA_DICT}
@@ -709,6 +740,22 @@ class DataDriver:
     Dialect <#file-encoding-and-csv-dialect>`__ settings you may configure which
     structure your data source has.
 
+    The option ``csv_engine`` selects how csv files are parsed:
+
+    - ``python`` (default): reads the file line by line with the Python ``csv`` module.
+    - ``fast``: parses the file in large blocks with multiple threads with ``pyarrow``, if it is installed.
+
+    .. code :: robotframework
+
+        *** Settings ***
+        Library    DataDriver    file=huge_data.csv    csv_engine=fast
+
+    With ``csv_engine=fast`` the Python ``csv`` module is still used,
+    if ``pyarrow`` is not installed or if the dialect uses ``skipinitialspace``,
+    a delimiter longer than one character or ``QUOTE_NONNUMERIC`` quoting.
+    All rows must have as many cells as the header.
+    Otherwise use ``csv_engine=python``, which ignores additional cells.
+
 
     XLS / XLSX Files
     ~~~~~~~~~~~~~~~~
@@ -735,6 +782,48 @@ class DataDriver:
         *** Settings ***
         Library    DataDriver    file=my_data_source.xlsx    sheet_name=2nd Sheet
 
+    Xlsx files are read with pandas if it is installed, otherwise directly with openpyxl.
+    The option ``xlsx_engine`` selects explicitly how xlsx files are read:
+
+    - ``pandas``: reads the whole sheet as pandas DataFrame.
+    - ``openpyxl``: reads the sheet row by row in read-only mode without pandas. This is faster and needs less memory.
+
+    .. code :: robotframework
+
+        *** Settings ***
+        Library    DataDriver    file=my_data_source.xlsx    xlsx_engine=openpyxl
+
+    Be aware that pandas may convert ``0`` and ``1`` cells to ``False`` and ``True`` and vice versa,
+    if these values are mixed in one column. With ``xlsx_engine=openpyxl`` every cell keeps its own type.
+
+    Several sheets and files can be read into one data table.
+    ``sheet_name`` may be a list of sheet names or indices or ``*`` for all sheets of the workbook,
+    and ``file`` may be a glob pattern like ``data/*.xlsx``.
+    The sheets are read concurrently in a process pool, because parsing Excel files is CPU-bound.
+    The option ``reader_processes`` limits the number of processes, which defaults to the number of CPUs.
+    ``reader_processes=1`` reads them one after the other without starting any process.
+
+    Each sheet needs its own header row. The test cases are kept in the order of
+    the sorted file names and the sheets of each workbook.
+    To see where a test case comes from, it gets the tag ``source:<file name>``
+    if ``file`` is a pattern and the tag ``sheet:<sheet name>`` if several sheets are read.
+    These tags can be used with ``--include`` and ``--exclude`` like any other tag.
+
+    .. code :: robotframework
+
+        *** Settings ***
+        Library    DataDriver    file=${CURDIR}/data/*.xlsx    sheet_name=*    reader_processes=4
+
+    or:
+
+    .. code :: robotframework
+
+        *** Variables ***
+        @{SHEETS}    Login    Checkout
+
+        *** Settings ***
+        Library    DataDriver    file=my_data_source.xlsx    sheet_name=${SHEETS}
+
 
     MS Excel and typed cells
     ^^^^^^^^^^^^^^^^^^^^^^^^
@@ -848,6 +937,54 @@ class DataDriver:
             Should Be Equal    ${TEST_NAME}    ${content}
 
 
+    JSON / JSON Lines
+    ~~~~~~~~~~~~~~~~~
+
+    A ``.json`` file contains one array of test cases with the keys ``test_case_name``,
+    ``arguments``, ``tags`` and ``documentation``, like ``${DataDriver_DATA_LIST}``.
+    The array is parsed incrementally, so just one test case at a time is decoded
+    and not the whole file is held in memory.
+
+    A ``.jsonl`` or ``.ndjson`` file (JSON Lines) contains one such test case object per line.
+    Empty lines are ignored. New test cases can be appended to the file without rewriting it.
+
+    .. code :: robotframework
+
+        *** Settings ***
+        Library    DataDriver    file=exported_tests.jsonl    streaming=True
+
+    .. code :: json
+
+        {"test_case_name": "first", "arguments": {"${username}": "demo", "${password}": "mode"}, "tags": ["smoke"]}
+        {"test_case_name": "second", "arguments": {"${username}": "${EMPTY}", "${password}": "mode"}}
+
+
+    Parquet / Arrow / Feather
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Files with the extension ``.parquet``, ``.arrow`` or ``.feather`` are read with pyarrow.
+    Their column names are the header, like the first row of a csv file.
+    The files are memory-mapped and only the columns of the test case name, tags,
+    documentation and arguments are read. All other columns are skipped.
+
+    Cells keep their types, like with ``preserve_xls_types=True`` for Excel files.
+    Integers, floats, booleans, dates and timestamps are handed over as Python objects
+    and empty cells as empty strings.
+    List columns are used as is for list arguments (``@{...}``),
+    struct columns for dictionary arguments (``&{...}``),
+    and the ``[Tags]`` column may be a list of strings as well.
+
+    If only some tests are selected by name, like with ``rerunfailed`` or pabot,
+    Parquet row groups are skipped if the min/max statistics of their test case names
+    contain none of the selected names.
+    This requires a string column for the test case names. Other columns are always read completely.
+
+    .. code :: robotframework
+
+        *** Settings ***
+        Library    DataDriver    file=generated_tests.parquet
+
+
     File Encoding and CSV Dialect
     -----------------------------
 
@@ -1110,6 +1247,12 @@ class DataDriver:
 
     See other readers as example.
 
+    Readers of table like sources can hand over the rows to ``self._analyse_header(header)``
+    and ``self._iter_test_case_data_in_blocks(rows)``.
+    It selects and converts the rows in blocks of 1000, column by column,
+    and yields the ``TestCaseData``. This is faster than converting the rows one by one
+    with ``self._read_data_from_table(row)``.
+
 
     Selection of Test Cases to Execute
     ----------------------------------
@@ -1304,6 +1447,8 @@ class DataDriver:
     - ``Equal``: means it creates equal sizes groups
     - ``Binary``: is more complex. it created a decreasing size of containers to support better balancing.
     - ``Atomic``: it does not group tests at all and runs really each test case in a separate thread.
+    - ``Weighted``: creates groups of nearly same duration, based on the durations of a previous execution.
+    - ``Guided``: creates decreasing groups, each of a size of the remaining tests divided by twice the processes.
 
     This can be set by ``optimize_pabot`` in Library import.
 
@@ -1336,6 +1481,165 @@ class DataDriver:
         P15: 39
         P16: 40
 
+    Weighted reads the elapsed time of each test from the file given by ``pabot_durations``.
+    That may be the ``output.xml`` of a previous execution or a JSON file
+    that maps the long names of the tests to seconds, like ``{"Suite.Test 1": 1.5}``.
+    The longest tests are distributed first, each to the process with the least total duration so far.
+    Tests that are not found in the durations get the median duration of the known tests.
+
+    Guided creates with 40 test cases and 4 processes groups of 5,5,4,4,3,3,2,2,2,2,1,1,1,1,1,1,1,1 tests.
+    Each group gets the remaining tests divided by twice the process count.
+    Big groups run first and the small groups at the end balance the processes.
+    ``pabot_min_chunk_size`` sets the minimum size of a group to reduce the overhead of many small groups.
+
+    .. code :: robotframework
+
+        *** Settings ***
+        Library          DataDriver    optimize_pabot=Guided    pabot_min_chunk_size=2
+
+    By default each group is handed to its pabot process as list of test names in ``${DYNAMICTESTS}``.
+    With many tests and long names these lists get very long.
+    With ``pabot_row_selection=True`` DataDriver hands over ranges of row indices instead,
+    like ``${DATADRIVER_ROWS}`` with the value ``<hash>:0-499,730-760``.
+    The indices count the rows that are not filtered out by tags.
+    The hash identifies the content of the data file,
+    so the tests fail if the data file is changed while pabot is running.
+    Data sources that are no files are still handed over by names.
+
+    If the PabotLib server lists XML-RPC ``system.multicall`` in ``system.listMethods``,
+    the groups or tests are added to the execution queue in batches of 1000, instead of one call each.
+    Otherwise, like with the current PabotLib, DataDriver falls back to one call per group or test.
+
+    .. code :: robotframework
+
+        *** Settings ***
+        Library          DataDriver    optimize_pabot=Weighted    pabot_durations=${EXECDIR}/last/output.xml
+
+
+    Large Data Sources
+    ------------------
+
+    By default DataDriver reads the whole data source into a list of ``TestCaseData``
+    before the first test case is created.
+    With data files of many thousand rows this may cost a lot of time and memory
+    before the first keyword is executed.
+
+
+    Streaming
+    ~~~~~~~~~
+
+    With ``streaming=True`` DataDriver creates, filters and adds the test cases
+    while the data source is read row by row.
+    Only the rows that are selected for execution are kept in memory.
+
+    .. code :: robotframework
+
+        *** Settings ***
+        Library          DataDriver    file=huge_data.csv    streaming=True
+
+    Readers must implement the method ``iter_data_from_source`` to yield ``TestCaseData`` row by row.
+    The readers for ``csv``, ``xlsx``, ``json``, ``jsonl``, ``parquet``, ``arrow`` and ``generic_csv_reader`` do so.
+    All other readers are read completely and then handed over one by one.
+
+    Be aware that with ``handle_template_tags=UnsetTags`` the tags of the template test
+    are removed from the generated tests after all rows have been read.
+    Filtering by ``include`` and ``exclude`` does still see the complete tags of the template test.
+
+
+    Parse Cache
+    ~~~~~~~~~~~
+
+    With ``cache_dir=`` DataDriver stores the parsed data table in the given directory.
+    The next time the same data file is read with the same reader settings, the data table is
+    loaded from that cache instead of being parsed again.
+    This is especially useful with pabot ``--testlevelsplit``, because each pabot process reads the data file.
+
+    A cache entry is identified by the resolved data file path, its modification time and size
+    and the reader settings like ``encoding``, ``dialect``, ``sheet_name``, ``reader_class``
+    and all additional reader arguments, as well as the DataDriver version and the modification time
+    of the reader module.
+    If the directory grows above ``cache_size`` (in MB, default 512), the least recently used entries are removed.
+
+    .. code :: robotframework
+
+        *** Settings ***
+        Library          DataDriver    file=huge_data.xlsx    cache_dir=${EXECDIR}/.datadriver_cache
+
+    Robot Framework® variables and ``e{}`` expressions in the data file are replaced while parsing
+    and may change between executions.
+    Therefore data tables that contain variables or expressions other than plain literals are not cached.
+    The cache is not used together with ``streaming=True`` or for data sources that are no files.
+
+    With pabot ``--testlevelsplit`` the process that fills the execution queue additionally stores
+    the test case data of each queued chunk of tests in the cache directory.
+    Each pabot worker then loads just the test case data of its own chunk
+    instead of reading the data file again.
+    With ``optimize_pabot=Atomic`` no chunks are stored, because each test would get its own cache file.
+    The workers then load the cached data table of the whole file instead.
+
+    If only some tests are selected by name, like with ``rerunfailed`` or pabot without chunks,
+    csv files are not read completely. Instead DataDriver stores an index of the byte offsets,
+    test case names and tags of all rows in the cache directory the first time such a selection is read.
+    The selected rows are then read directly from the memory-mapped file.
+    This requires an encoding in which each line ends with a line feed byte, like ``utf_8`` or ``cp1252``.
+
+
+    Row Filter Pushdown
+    ~~~~~~~~~~~~~~~~~~~
+
+    DataDriver hands the ``include`` and ``exclude`` tag patterns and the test names selected
+    by pabot or ``rerunfailed`` (``${DYNAMICTESTS}``) over to the reader before reading.
+    The readers for ``csv``, ``xlsx``, ``xls``, ``json``, ``jsonl``, ``parquet``, ``arrow``, ``pict``, ``glob``
+    and ``generic_csv_reader`` skip the rows that are filtered out anyway, before their arguments are converted.
+
+    Custom readers can do the same by checking ``self._is_table_row_selected(row)``
+    before calling ``self._create_test_case_data(row)``.
+    Readers that use ``self._read_data_from_table(row)`` or
+    ``self._iter_test_case_data_in_blocks(rows)`` do so already.
+
+    Tags are not pushed down if ``handle_template_tags=UnsetTags`` is used without streaming
+    and the template test has tags, because the tags of the template test then depend on all rows.
+    If the data table is read from or stored to the `Parse Cache`_, nothing is pushed down,
+    because the cache stores the complete data table.
+    This does not apply to ``streaming=True`` or to csv rows selected by name and read by the row index.
+
+
+    Statistics
+    ~~~~~~~~~~
+
+    DataDriver measures the wall time of each phase of the start of a data-driven suite
+    and stores it together with the row counts in the suite variable ``${DataDriver_STATS}``.
+
+    .. code :: robotframework
+
+        *** Settings ***
+        Library          DataDriver    file=huge_data.csv    stats=True    stats_file=${OUTPUT DIR}/datadriver_stats.jsonl
+
+    ``${DataDriver_STATS}`` is a dictionary with these items:
+
+    - ``suite``: long name of the suite
+    - ``timestamp``: UTC time the statistics were finished, in ISO 8601 format
+    - ``total``: seconds from the start of the suite until all tests were added
+    - ``phases``: seconds per phase. These are ``config_keyword``, ``resolve_file``, ``reader_import``,
+      ``parse``, ``template``, ``filter``, ``create_tests``, ``pabot_queue`` and ``set_variables``
+    - ``rows``: number of rows read from the data source
+    - ``rows_filtered``: number of rows that have been filtered out by tags or names
+    - ``tests``: number of tests that have been created
+    - ``cache_hits``: 1 if the data table was loaded from the `Parse Cache`_, otherwise 0. Only with ``cache_dir=``
+    - ``memory_peak_mb``: peak of the memory allocated by Python in MB. Only with ``stats_memory=True``
+
+    With ``streaming=True`` the data source is read while filtering,
+    so the time of parsing is part of ``filter`` instead of ``parse``.
+
+    With ``stats=True`` the statistics are also added as suite metadata ``DataDriver Stats``.
+    With ``stats_file=`` each suite appends its statistics as one line of JSON to the given file.
+    Relative paths are resolved from the current working directory.
+    Also each pabot process appends its own line, so the file can be used to compare
+    the start-up costs of many executions.
+
+    ``stats_memory=True`` measures the memory with Python ``tracemalloc``.
+    That slows down the parsing noticeably and should only be used for analysis.
+
     """
     # endregion
 
@@ -1356,7 +1660,7 @@ class DataDriver:
         skipinitialspace: bool = False,
         lineterminator: str = "\r\n",
         *,
-        sheet_name: Union[str, int] = 0,
+        sheet_name: Union[str, int, List[Union[str, int]]] = 0,
         reader_class: Optional[Union[AbstractReaderClass, str]] = None,
         file_search_strategy: str = "PATH",
         file_regex: str = r"(?i)(.*?)(\.csv)",
@@ -1366,6 +1670,15 @@ class DataDriver:
         listseperator: str = ",",
         config_keyword: Optional[str] = None,
         optimize_pabot: PabotOpt = PabotOpt.Equal,
+        pabot_durations: Optional[str] = None,
+        pabot_min_chunk_size: int = 1,
+        pabot_row_selection: bool = False,
+        streaming: bool = False,
+        stats: bool = False,
+        stats_file: Optional[str] = None,
+        stats_memory: bool = False,
+        cache_dir: Optional[str] = None,
+        cache_size: int = 512,
         **kwargs: Any,
     ):
         # region: docstring
@@ -1403,6 +1716,15 @@ Options
     ...    listseperator=,
     ...    config_keyword=None
     ...    optimize_pabot=Equal
+    ...    pabot_durations=None
+    ...    pabot_min_chunk_size=1
+    ...    pabot_row_selection=False
+    ...    streaming=False
+    ...    stats=False
+    ...    stats_file=None
+    ...    stats_memory=False
+    ...    cache_dir=None
+    ...    cache_size=512
     ...    &{kwargs}
 
 File
@@ -1465,6 +1787,46 @@ Optimize Pabot
 
 When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit`` to be faster.
 
+
+Pabot Durations
+^^^^^^^^^^^^^^^
+
+``output.xml`` of a previous execution or JSON duration history used by ``optimize_pabot=Weighted``.
+
+
+Pabot Min Chunk Size
+^^^^^^^^^^^^^^^^^^^^
+
+Minimum number of tests per group for ``optimize_pabot=Guided``.
+
+
+Pabot Row Selection
+^^^^^^^^^^^^^^^^^^^
+
+Hands the tests to the pabot processes as ranges of row indices instead of test names.
+
+
+Streaming
+^^^^^^^^^
+
+Reads the data source row by row and creates the tests while reading,
+instead of loading the whole data table first.
+
+
+Stats, Stats File & Stats Memory
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Adds the timings and row counts of the suite start as suite metadata,
+appends them to a JSON lines file and measures the peak memory usage.
+``${DataDriver_STATS}`` is set in any case.
+
+
+Cache Dir & Cache Size
+^^^^^^^^^^^^^^^^^^^^^^
+
+Directory in which parsed data tables are cached between executions
+and the maximum size of that directory in MB.
+
         """
         # endregion
         self.ROBOT_LIBRARY_LISTENER = self
@@ -1501,6 +1863,15 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
             list_separator=listseperator,
             config_keyword=config_keyword,
             optimize_pabot=optimize_pabot,
+            pabot_durations=pabot_durations,
+            pabot_min_chunk_size=pabot_min_chunk_size,
+            pabot_row_selection=pabot_row_selection,
+            streaming=streaming,
+            stats=stats,
+            stats_file=stats_file,
+            stats_memory=stats_memory,
+            cache_dir=cache_dir,
+            cache_size=cache_size,
             **kwargs,
         )
 
@@ -1510,7 +1881,12 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
         self.template_test: Optional[TestCase] = None
         self.template_keyword = None
         self.data_table = None
-        self.data_table_dict = DotDict()
+        self.pruned_tags: Set[str] = set()
+        self.data_tags: Set[str] = set()
+        self.pabot_chunk_loaded = False
+        self.data_reader: Optional[AbstractReaderClass] = None
+        self.stats = SuiteStats("")
+        self.data_table_dict = TestCaseDataDict(TestCaseDataList())
         self.test_case_data = TestCaseData()
 
     def _start_suite(self, suite: TestSuite, *_):
@@ -1522,23 +1898,32 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
         """
         try:
             self.suite_name = suite.longname
+            self.stats = SuiteStats(self.suite_name)
             self.template_test = suite.tests[0]
-            self._update_config()
+            with self.stats.phase("config_keyword"):
+                self._update_config()
+            if self.reader_config.stats_memory:  # the config keyword may set it
+                self.stats.start_memory_trace()
             self.suite_source = suite.source
             self._create_data_table()
             debug("[ DataDriver ] data Table created")
-            self.template_keyword = self._get_template_keyword(suite)
-            self._clean_template_test()
+            with self.stats.phase("template"):
+                self.template_keyword = self._get_template_keyword(suite)
+                self._clean_template_test()
             test_list = self._get_filtered_test_list()
-            if self._handle_pabot(test_list):
+            with self.stats.phase("pabot_queue"):
+                is_pabot_queue = self._handle_pabot(test_list)
+            if is_pabot_queue:
                 suite.tests.clear()
                 suite.setup = None
                 suite.teardown = None
             else:
                 suite.tests.clear()
                 suite.tests.extend(test_list)
-            self._set_date_table_to_robot_variable()
+            with self.stats.phase("set_variables"):
+                self._set_date_table_to_robot_variable()
             debug(f"[ DataDriver ] {len(test_list)} tests added.")
+            self._publish_stats()
         except Exception as exception:
             error(f'[ DataDriver ] Error in robot file:\n  File "{suite.source}", line 0')
             if self.reader_config.file:
@@ -1548,6 +1933,16 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
                 )
             debug(traceback.format_exc())
             raise exception
+        finally:
+            self.stats.stop()
+
+    def _publish_stats(self):
+        stats = self.stats.finish()
+        BuiltIn().set_suite_variable("${DataDriver_STATS}", DotDict(stats))
+        if self.reader_config.stats:
+            BuiltIn().set_suite_metadata("DataDriver Stats", format_stats(stats))
+        append_stats(self.reader_config.stats_file, stats)
+        debug(f"[ DataDriver ] Stats: {format_stats(stats)}")
 
     def _start_test(self, test: TestCase, *_):
         BuiltIn().set_test_variable(
@@ -1556,12 +1951,18 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
         )
 
     def _set_date_table_to_robot_variable(self):
-        BuiltIn().set_suite_variable("${DataDriver_DATA_LIST}", self.data_table)
-        self.data_table_dict = DotDict([(item.test_case_name, item) for item in self.data_table])
+        """Hands the selected test cases over to Robot Framework.
+
+        The compact ``TestCaseData`` rows are kept and only converted to ``DotDict``
+        when a row is read from one of the variables.
+        """
+        data_list = TestCaseDataList(self.data_table)
+        BuiltIn().set_suite_variable("${DataDriver_DATA_LIST}", data_list)
+        self.data_table_dict = TestCaseDataDict(data_list)
         BuiltIn().set_suite_variable("${DataDriver_DATA_DICT}", self.data_table_dict)
 
     def _get_all_tags(self):
-        all_tags = set()
+        all_tags = set(self.pruned_tags)
         for test_data in self.data_table:
             all_tags.update(test_data.tags or [])
         return all_tags
@@ -1569,11 +1970,23 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
     def _clean_template_test(self):
         if self.handle_template_tags == TagHandling.NoTags:
             self.template_test.tags = Tags()
-        elif self.handle_template_tags == TagHandling.UnsetTags:
+        elif (
+            self.handle_template_tags == TagHandling.UnsetTags and not self.reader_config.streaming
+        ):
             for tag in self._get_all_tags():
                 self.template_test.tags.remove(tag)
         self.template_test.body = None
 
+    def _unset_streamed_template_tags(self, test_list, data_table, all_tags):
+        remaining_tags = Tags(self.template_test.tags)
+        remaining_tags.remove(all_tags)
+        unset_tags = [tag for tag in self.template_test.tags if tag not in list(remaining_tags)]
+        if not unset_tags:
+            return
+        for test, test_case_data in zip(test_list, data_table):
+            data_tags = Tags(tag.strip() for tag in test_case_data.tags or [])
+            test.tags.remove([tag for tag in unset_tags if tag not in data_tags])
+
     def _update_config(self):
         if self.config_dict.config_keyword:
             config = self.config_dict
@@ -1581,41 +1994,69 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
             self.reader_config = ReaderConfig(**{**config, **config_update})
 
     def _get_filtered_test_list(self):
+        start_time = time.perf_counter()
+        create_time = 0.0
+        rows_read = 0
         temp_test_list = []
         temp_data_table = []
-        dynamic_test_list = get_filter_dynamic_test_names()
+        data_tags = set()
+        dynamic_test_names = get_filter_dynamic_test_names()
+        row_selection = self._get_row_selection()
+        last_row = max(row_selection, default=-1) if row_selection is not None else None
+        read_all_rows = (
+            self.reader_config.streaming and self.handle_template_tags == TagHandling.UnsetTags
+        )
+        tag_filter = TagFilter(
+            self.include, self.exclude, self.template_test.tags, self.handle_template_tags
+        )
+        row_index = -1
         for self.test_case_data in self.data_table:  # noqa: B020
-            if self._included_by_tags() and self._not_excluded_by_tags():
+            rows_read += 1
+            data_tags.update(self.test_case_data.tags or [])
+            if not tag_filter.match(self.test_case_data.tags):
+                continue
+            row_index += 1
+            if row_selection is not None and row_index not in row_selection:
+                if row_index > last_row and not read_all_rows:
+                    break
+                continue
+            if self._selected_by_name(dynamic_test_names):
+                create_start_time = time.perf_counter()
                 self._create_test_from_template()
-                if (
-                    dynamic_test_list is None
-                    or f"{self.test.parent.name}.{self.test.name}" in dynamic_test_list
-                    or self.test.longname in dynamic_test_list
-                ):
-                    temp_test_list.append(self.test)
-                    temp_data_table.append(self.test_case_data)
+                create_time += time.perf_counter() - create_start_time
+                temp_test_list.append(self.test)
+                temp_data_table.append(self.test_case_data)
         self.data_table = temp_data_table
+        self.data_tags = data_tags | self.pruned_tags
+        if self.reader_config.streaming and self.handle_template_tags == TagHandling.UnsetTags:
+            self._unset_streamed_template_tags(temp_test_list, temp_data_table, self.data_tags)
+        pruned_rows = self.data_reader.pruned_rows if self.data_reader is not None else 0
+        self.stats.count("rows", rows_read + pruned_rows)
+        self.stats.count("rows_filtered", rows_read + pruned_rows - len(temp_test_list))
+        self.stats.count("tests", len(temp_test_list))
+        self.stats.add_time("filter", time.perf_counter() - start_time - create_time)
+        self.stats.add_time("create_tests", create_time)
         return temp_test_list
 
-    def _included_by_tags(self):
-        if self.include and isinstance(self.test_case_data.tags, list):
-            return self._filter_tag(self.include)
-        return True
-
-    def _not_excluded_by_tags(self):
-        if self.exclude and isinstance(self.test_case_data.tags, list):
-            return not self._filter_tag(self.exclude)
-        return True
-
-    def _filter_tag(self, filter_setting):
-        tags = Tags()
-        if (
-            self.handle_template_tags != TagHandling.DefaultTags
-            or len(self.test_case_data.tags) == 0
-        ):
-            tags.add(self.template_test.tags)
-        tags.add(self.test_case_data.tags)
-        return tags.match(filter_setting)
+    def _get_row_selection(self) -> Optional[Set[int]]:
+        row_selection = get_variable_value("${DATADRIVER_ROWS}")
+        if not row_selection or self.pabot_chunk_loaded:
+            return None
+        content_hash, _, row_ranges = str(row_selection).partition(":")
+        if content_hash != file_content_hash(self.reader_config.file):
+            raise ValueError(
+                f"Data file '{self.reader_config.file}' has changed since the pabot queue was created."
+            )
+        return decode_row_ranges(row_ranges)
+
+    def _selected_by_name(self, dynamic_test_names):
+        if dynamic_test_names is None:
+            return True
+        test_name = self._get_test_case_name()
+        return (
+            f"{self.template_test.parent.name}.{test_name}" in dynamic_test_names
+            or f"{self.suite_name}.{test_name}" in dynamic_test_names
+        )
 
     def _create_data_table(self):
         """
@@ -1623,10 +2064,125 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
         Keys are header names.
         Values are data of this column as array.
         """
-        self._resolve_file_attribute()
-        self.data_table = self._data_reader().get_data_from_source()
-        debug(f"[ DataDriver ] Opening file '{self.reader_config.file}'")
-        debug(f"[ DataDriver ] {len(self.data_table)} Test Cases loaded...")
+        with self.stats.phase("resolve_file"):
+            self._resolve_file_attribute()
+        with self.stats.phase("reader_import"):
+            self.data_reader = self._data_reader()
+        if (
+            self.reader_config.file_search_strategy == "PATH"
+            and is_file_pattern(self.reader_config.file)
+            and not self.data_reader.supports_file_patterns
+        ):
+            raise ValueError(
+                f"{type(self.data_reader).__name__} does not support file patterns like "
+                f"'{self.reader_config.file}'."
+            )
+        self.pruned_tags = self.data_reader.pruned_tags
+        with self.stats.phase("parse"):
+            self.pabot_chunk_loaded = self._load_pabot_chunk()
+            if self.pabot_chunk_loaded:
+                return
+            self._push_down_row_filter(self.data_reader)
+            debug(f"[ DataDriver ] Opening file '{self.reader_config.file}'")
+            if self.reader_config.streaming:
+                self.data_table = self.data_reader.iter_data_from_source()
+                debug("[ DataDriver ] Streaming Test Cases...")
+            else:
+                self.data_table = self._get_data_table(self.data_reader)
+                debug(f"[ DataDriver ] {len(self.data_table)} Test Cases loaded...")
+
+    def _push_down_row_filter(self, data_reader: AbstractReaderClass):
+        tag_filter = None
+        if self.handle_template_tags == TagHandling.NoTags:
+            tag_filter = TagFilter(self.include, self.exclude, [], self.handle_template_tags)
+        elif (
+            self.handle_template_tags != TagHandling.UnsetTags
+            or self.reader_config.streaming
+            or not self.template_test.tags
+        ):
+            tag_filter = TagFilter(
+                self.include, self.exclude, self.template_test.tags, self.handle_template_tags
+            )
+        data_reader.set_row_filter(tag_filter, self._get_selected_test_names())
+        if self._uses_parse_cache(data_reader):
+            data_reader.set_row_filter()  # the parse cache stores the complete data table
+
+    def _uses_parse_cache(self, data_reader: AbstractReaderClass) -> bool:
+        return (
+            bool(self.reader_config.cache_dir)
+            and not self.reader_config.streaming
+            and not data_reader.reads_indexed_rows()
+        )
+
+    def _get_selected_test_names(self) -> Optional[Set[str]]:
+        dynamic_test_names = get_filter_dynamic_test_names()
+        if dynamic_test_names is None:
+            return None
+        prefixes = {f"{self.template_test.parent.name}.", f"{self.suite_name}."}
+        return {
+            name[len(prefix) :]
+            for name in dynamic_test_names
+            for prefix in prefixes
+            if name.startswith(prefix)
+        }
+
+    def _get_data_table(self, data_reader: AbstractReaderClass):
+        cache = self._get_parse_cache()
+        if cache is None or not self._uses_parse_cache(data_reader):
+            return data_reader.get_data_from_source()
+        cache_key = cache.get_key(self.reader_config)
+        data_table = cache.load(cache_key)
+        self.stats.count("cache_hits", int(data_table is not None))
+        if data_table is None:
+            data_table = data_reader.get_data_from_source()
+            if data_reader.uses_variables:
+                debug("[ DataDriver ] Data table is not cached, because it depends on variables.")
+            else:
+                cache.store(cache_key, data_table)
+        return data_table
+
+    def _get_parse_cache(self) -> Optional["ParseCache"]:
+        if not self.reader_config.cache_dir:
+            return None
+        from .parse_cache import ParseCache  # noqa: PLC0415  # pickle is only needed with cache_dir
+
+        return ParseCache(self.reader_config.cache_dir, self.reader_config.cache_size)
+
+    def _load_pabot_chunk(self) -> bool:
+        cache = self._get_parse_cache()
+        queue_variable = get_pabot_queue_variable()
+        if cache is None or queue_variable is None:
+            return False
+        chunk = cache.load(cache.get_key(self.reader_config, queue_variable))
+        self.stats.count("cache_hits", int(chunk is not None))
+        if chunk is None:
+            return False
+        self.data_table = chunk["data_table"]
+        self.pruned_tags = set(chunk["data_tags"])
+        debug(f"[ DataDriver ] {len(self.data_table)} Test Cases loaded from pabot chunk...")
+        return True
+
+    def _store_pabot_chunks(self, test_list, chunks, queue_variables):
+        cache = self._get_parse_cache()
+        if cache is None or (self.data_reader is not None and self.data_reader.uses_variables):
+            return
+        if self.reader_config.optimize_pabot == PabotOpt.Atomic:
+            return  # one cache file per test would flood the cache directory
+        data_by_test = {id(test): data for test, data in zip(test_list, self.data_table)}
+        data_by_name = defaultdict(list)
+        for test_case_data in self.data_table:
+            data_by_name[test_case_data.test_case_name].append(test_case_data)
+        for chunk, queue_variable in zip(chunks, queue_variables):
+            if not chunk:
+                continue
+            if self._uses_row_selection():
+                data_table = [data_by_test[id(test)] for test in chunk]
+            else:
+                test_names = dict.fromkeys(test.name for test in chunk)
+                data_table = [data for name in test_names for data in data_by_name[name]]
+            chunk_data = {"data_table": data_table, "data_tags": sorted(self.data_tags)}
+            cache.store(cache.get_key(self.reader_config, queue_variable), chunk_data, evict=False)
+        cache.evict()
 
     def _data_reader(self) -> AbstractReaderClass:
         reader_class = self.reader_config.reader_class
@@ -1702,7 +2258,9 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
                 return
             if self._check_valid_glob():
                 return
-            if (not configured_file) or (not configured_file[: configured_file.rfind(".")]):
+            if is_file_pattern(configured_file) and not self._is_file_in_suite_dir(configured_file):
+                self._resolve_file_pattern()
+            elif (not configured_file) or (not configured_file[: configured_file.rfind(".")]):
                 self._set_data_file_to_suite_source()
             else:
                 self._check_if_file_exists_as_path_or_in_suite()
@@ -1741,6 +2299,20 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
                     f"File attribute was not a full path. Tried to find {file_in_suite_dir} but file does not exist."
                 )
 
+    def _is_file_in_suite_dir(self, file: str) -> bool:
+        return (Path(self.suite_source).parent / file).is_file()
+
+    def _resolve_file_pattern(self):
+        """Resolves ``file`` as glob pattern, if it is no existing file, neither as path nor in the suite dir."""
+        file_pattern = str(self.reader_config.file)
+        if glob(file_pattern):
+            return
+        pattern_in_suite_dir = str(Path(self.suite_source).parent / file_pattern)
+        if glob(pattern_in_suite_dir):
+            self.reader_config.file = pattern_in_suite_dir
+        else:
+            self._check_if_file_exists_as_path_or_in_suite()
+
     def _check_valid_glob(self):
         if self.reader_config.reader_class != "glob_reader":
             return None
@@ -1762,6 +2334,7 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
         if (
             get_variable_value("${DYNAMICTEST}")
             or get_variable_value("${DYNAMICTESTS}")
+            or get_variable_value("${DATADRIVER_ROWS}")
             or not self.robot_options["test"]
             or not get_variable_value("${PABOTQUEUEINDEX}")
         ):
@@ -1783,7 +2356,7 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
             pabotlib = Remote(pabotlib_url)
             if not pabotlib:
                 raise ConnectionError
-            self._create_pabot_queue(pabot_process_count, pabotlib, test_list)
+            self._create_pabot_queue(pabot_process_count, pabotlib, test_list, pabotlib_url)
         except (RuntimeError, ConnectionError) as e:
             error(e)
             error(
@@ -1795,36 +2368,83 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
         pabotlib.run_keyword("ignore_execution", [get_variable_value("${CALLER_ID}")], {})
         return True
 
-    def _create_pabot_queue(self, pabot_process_count, pabotlib, test_list):
+    def _create_pabot_queue(self, pabot_process_count, pabotlib, test_list, pabotlib_url=None):
+        from .pabot_queue import (  # noqa: PLC0415  # only the process filling the queue needs it
+            add_to_pabot_queue,
+            encode_row_ranges,
+            guided_partition_test_list,
+            weighted_partition_test_list,
+        )
+
         pabot_opt = self.reader_config.optimize_pabot
         if pabot_opt == PabotOpt.Atomic:
-            self._add_test_to_pabot_queue(pabotlib, test_list)
+            process_test_lists = [[test] for test in test_list]
+        elif pabot_opt == PabotOpt.Weighted:
+            process_test_lists = weighted_partition_test_list(
+                test_list, self._get_test_durations(test_list), pabot_process_count
+            )
+        elif pabot_opt == PabotOpt.Guided:
+            process_test_lists = guided_partition_test_list(
+                test_list, pabot_process_count, self.reader_config.pabot_min_chunk_size
+            )
+        elif pabot_opt == PabotOpt.Binary:
+            process_test_lists = binary_partition_test_list(test_list, pabot_process_count)
         else:
-            if pabot_opt == PabotOpt.Binary:
-                partitioner = binary_partition_test_list
-            else:
-                partitioner = equally_partition_test_list
-            for process_test_list in partitioner(test_list, pabot_process_count):
-                self._add_test_list_to_pabot_queue(pabotlib, process_test_list)
+            process_test_lists = equally_partition_test_list(test_list, pabot_process_count)
+        if self._uses_row_selection():
+            content_hash = file_content_hash(self.reader_config.file)
+            row_indices = {id(test): row_index for row_index, test in enumerate(test_list)}
+            queue_variables = [
+                f"DATADRIVER_ROWS:{content_hash}:"
+                f"{encode_row_ranges(row_indices[id(test)] for test in process_test_list)}"
+                for process_test_list in process_test_lists
+            ]
+        elif pabot_opt == PabotOpt.Atomic:
+            queue_variables = [f"DYNAMICTEST:{self.suite_name}.{test.name}" for test in test_list]
+        else:
+            queue_variables = [
+                self._get_dynamic_tests_variable(process_test_list)
+                for process_test_list in process_test_lists
+            ]
+        self._store_pabot_chunks(test_list, process_test_lists, queue_variables)
+        add_to_pabot_queue(pabotlib, pabotlib_url, self.suite_name, queue_variables)
+
+    def _uses_row_selection(self) -> bool:
+        return bool(
+            self.reader_config.pabot_row_selection
+            and self.reader_config.file
+            and Path(self.reader_config.file).is_file()
+        )
 
-    def _add_test_list_to_pabot_queue(self, pabotlib, test_list):
+    def _get_test_durations(self, test_list) -> List[Optional[float]]:
+        durations_file = self.reader_config.pabot_durations
+        if not durations_file:
+            warn("optimize_pabot=Weighted needs pabot_durations. Test durations are unknown.")
+            return [None] * len(test_list)
+        durations_path = Path(durations_file)
+        if not durations_path.is_absolute() and not durations_path.is_file():
+            durations_path = Path(self.suite_source).parent / durations_path
+        from .durations import read_test_durations  # noqa: PLC0415
+
+        try:
+            durations = read_test_durations(str(durations_path))
+        except Exception as e:
+            warn(f"Test durations could not be read from '{durations_file}': {e}")
+            return [None] * len(test_list)
+        return [
+            durations.get(
+                f"{self.suite_name}.{test.name}",
+                durations.get(f"{self.template_test.parent.name}.{test.name}"),
+            )
+            for test in test_list
+        ]
+
+    def _get_dynamic_tests_variable(self, test_list):
         test_names = [f"{self.suite_name}.{test.name}" for test in test_list]
         pabot_string = "|".join(
             [name.replace("\\", "\\\\").replace("|", "\\|") for name in test_names]
         )
-        pabotlib.run_keyword(
-            "add_suite_to_execution_queue",
-            [self.suite_name, [f"DYNAMICTESTS:{pabot_string}"]],
-            {},
-        )
-
-    def _add_test_to_pabot_queue(self, pabotlib, test_list):
-        for test in test_list:
-            pabotlib.run_keyword(
-                "add_suite_to_execution_queue",
-                [self.suite_name, [f"DYNAMICTEST:{self.suite_name}.{test.name}"]],
-                {},
-            )
+        return f"DYNAMICTESTS:{pabot_string}"
 
     def _get_template_keyword(self, suite):
         template = self.template_test.template
@@ -1850,14 +2470,15 @@ When DataDriver is used together with Pabot, it optimizes the ``--testlevelsplit
         self._replace_test_case_doc()
 
     def _replace_test_case_name(self):
+        self.test.name = self._get_test_case_name()
+
+    def _get_test_case_name(self):
         if not self.test_case_data.test_case_name:
-            for variable_name in self.test_case_data.arguments:
-                self.test.name = self.test.name.replace(
-                    variable_name, str(self.test_case_data.arguments[variable_name])
-                )
-            self.test_case_data.test_case_name = self.test.name
-        else:
-            self.test.name = self.test_case_data.test_case_name
+            test_case_name = self.template_test.name
+            for variable_name, value in self.test_case_data.arguments.items():
+                test_case_name = test_case_name.replace(variable_name, str(value))
+            self.test_case_data.test_case_name = test_case_name
+        return self.test_case_data.test_case_name
 
     def _replace_test_case_keywords(self):
         self.test.setup = self.template_test.setup
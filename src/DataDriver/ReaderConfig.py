@@ -13,7 +13,8 @@
 # limitations under the License.
 
 
-from typing import Any, Dict, List, Optional
+from collections.abc import MutableMapping
+from typing import Any, Dict, List, Optional, Tuple
 
 from robot.utils import DotDict  # type: ignore
 
@@ -44,6 +45,15 @@ class ReaderConfig:
         list_separator: Optional[str] = ",",
         config_keyword: Optional[str] = None,
         optimize_pabot: PabotOpt = PabotOpt.Equal,
+        pabot_durations: Optional[str] = None,
+        pabot_min_chunk_size: int = 1,
+        pabot_row_selection: bool = False,
+        streaming: bool = False,
+        stats: bool = False,
+        stats_file: Optional[str] = None,
+        stats_memory: bool = False,
+        cache_dir: Optional[str] = None,
+        cache_size: int = 512,
         **kwargs,
     ):
         self.file = file
@@ -65,10 +75,105 @@ class ReaderConfig:
         self.list_separator = list_separator
         self.config_keyword = config_keyword
         self.optimize_pabot = optimize_pabot
+        self.pabot_durations = pabot_durations
+        self.pabot_min_chunk_size = pabot_min_chunk_size
+        self.pabot_row_selection = pabot_row_selection
+        self.streaming = streaming
+        self.stats = stats
+        self.stats_file = stats_file
+        self.stats_memory = stats_memory
+        self.cache_dir = cache_dir
+        self.cache_size = cache_size
         self.kwargs = kwargs
 
 
-class TestCaseData(DotDict):
+ARGUMENT_NAMES_CACHE_SIZE = 1024
+_ARGUMENT_NAMES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def shared_argument_names(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Returns an equal tuple of argument names that is shared by all rows with this header.
+
+    At most ``ARGUMENT_NAMES_CACHE_SIZE`` headers are shared, any further ones are used as they are.
+    """
+    shared_names = _ARGUMENT_NAMES.get(names)
+    if shared_names is not None:
+        return shared_names
+    if len(_ARGUMENT_NAMES) < ARGUMENT_NAMES_CACHE_SIZE:
+        _ARGUMENT_NAMES[names] = names
+    return names
+
+
+class TestCaseArguments(MutableMapping):
+    """Dictionary view on the arguments of one ``TestCaseData``.
+
+    The argument names are a tuple shared by all rows with the same header,
+    the values are stored per row as tuple.
+    """
+
+    __slots__ = ("_test_case_data",)
+
+    def __init__(self, test_case_data: "TestCaseData"):
+        self._test_case_data = test_case_data
+
+    def __getitem__(self, key):
+        return self._test_case_data._argument_values[self._index(key)]
+
+    def __setitem__(self, key, value):
+        names = self._test_case_data._argument_names
+        values = self._test_case_data._argument_values
+        if key in names:
+            index = names.index(key)
+            values = (*values[:index], value, *values[index + 1 :])
+        else:
+            names = (*names, key)
+            values = (*values, value)
+        self._test_case_data._argument_names = names
+        self._test_case_data._argument_values = values
+
+    def __delitem__(self, key):
+        index = self._index(key)
+        names = self._test_case_data._argument_names
+        values = self._test_case_data._argument_values
+        self._test_case_data._argument_names = (*names[:index], *names[index + 1 :])
+        self._test_case_data._argument_values = (*values[:index], *values[index + 1 :])
+
+    def __iter__(self):
+        return iter(self._test_case_data._argument_names)
+
+    def __len__(self):
+        return len(self._test_case_data._argument_names)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def _index(self, key):
+        try:
+            return self._test_case_data._argument_names.index(key)
+        except ValueError:
+            raise KeyError(key) from None
+
+
+class TestCaseData(MutableMapping):
+    """Data of one data-driven test case.
+
+    Behaves like a ``DotDict`` with the keys ``test_case_name``, ``arguments``,
+    ``tags`` and ``documentation``, but uses ``__slots__`` to keep big data tables small.
+    Further keys and attributes set by custom readers are stored in the instance ``__dict__``,
+    which is only created if they are used.
+    ``to_dot_dict`` returns the ``DotDict`` that DataDriver hands over to Robot Framework.
+    """
+
+    __slots__ = (
+        "__dict__",
+        "_argument_names",
+        "_argument_values",
+        "documentation",
+        "tags",
+        "test_case_name",
+    )
+    _keys = ("test_case_name", "arguments", "tags", "documentation")
+
     def __init__(
         self,
         test_case_name: str = "",
@@ -76,8 +181,182 @@ class TestCaseData(DotDict):
         tags: Optional[List] = None,
         documentation: Optional[str] = None,
     ):
-        super().__init__()
         self.test_case_name = test_case_name
-        self.arguments = arguments if arguments else {}
+        self.arguments = arguments
         self.tags = tags
         self.documentation = documentation
+
+    @classmethod
+    def from_values(
+        cls,
+        test_case_name: str,
+        argument_names: Tuple[str, ...],
+        argument_values: Tuple,
+        tags: Optional[List] = None,
+        documentation: Optional[str] = None,
+    ) -> "TestCaseData":
+        """Creates a ``TestCaseData`` from unique argument names and their values
+        without building an arguments dictionary first.
+
+        ``argument_names`` should be the tuple returned by ``shared_argument_names``,
+        so all rows with the same header share it.
+        """
+        test_case_data = cls.__new__(cls)
+        test_case_data.test_case_name = test_case_name
+        test_case_data._argument_names = argument_names
+        test_case_data._argument_values = argument_values
+        test_case_data.tags = tags
+        test_case_data.documentation = documentation
+        return test_case_data
+
+    @property
+    def arguments(self) -> TestCaseArguments:
+        return TestCaseArguments(self)
+
+    @arguments.setter
+    def arguments(self, arguments: Optional[Dict]):
+        arguments = arguments if arguments else {}
+        self._argument_names = shared_argument_names(tuple(arguments))
+        self._argument_values = tuple(arguments.values())
+
+    def to_dot_dict(self) -> DotDict:
+        dot_dict = DotDict()
+        dot_dict.test_case_name = self.test_case_name
+        dot_dict.arguments = dict(self.arguments)
+        dot_dict.tags = self.tags
+        dot_dict.documentation = self.documentation
+        dot_dict.update(self.__dict__)
+        return dot_dict
+
+    def __getitem__(self, key):
+        if key in self._keys:
+            return getattr(self, key)
+        return self.__dict__[key]
+
+    def __setitem__(self, key, value):
+        if key in self._keys:
+            setattr(self, key, value)
+        else:
+            self.__dict__[key] = value
+
+    def __delitem__(self, key):
+        if key in self._keys:
+            raise KeyError(f"'{key}' can not be removed from TestCaseData.")
+        del self.__dict__[key]
+
+    def __iter__(self):
+        yield from self._keys
+        yield from self.__dict__
+
+    def __len__(self):
+        return len(self._keys) + len(self.__dict__)
+
+    def __repr__(self):
+        return repr(self.to_dot_dict())
+
+    def __getstate__(self):
+        return (
+            self.test_case_name,
+            self._argument_names,
+            self._argument_values,
+            self.tags,
+            self.documentation,
+            self.__dict__ or None,
+        )
+
+    def __setstate__(self, state):
+        (
+            self.test_case_name,
+            argument_names,
+            self._argument_values,
+            self.tags,
+            self.documentation,
+            extra,
+        ) = state
+        self._argument_names = shared_argument_names(argument_names)
+        if extra:
+            self.__dict__.update(extra)
+
+
+class TestCaseDataList(list):
+    """List of ``TestCaseData`` that hands out each row as ``DotDict`` when it is read.
+
+    The ``DotDict`` of a row is created on first access and reused afterwards,
+    so rows that are never read by a keyword stay compact.
+    """
+
+    __slots__ = ("_dot_dicts",)
+
+    def __init__(self, rows=()):
+        super().__init__(rows)
+        self._dot_dicts: Dict[int, DotDict] = {}
+
+    def as_dot_dict(self, row):
+        if not isinstance(row, TestCaseData):
+            return row
+        dot_dict = self._dot_dicts.get(id(row))
+        if dot_dict is None:
+            dot_dict = self._dot_dicts[id(row)] = row.to_dot_dict()
+        return dot_dict
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.as_dot_dict(row) for row in super().__getitem__(index)]
+        return self.as_dot_dict(super().__getitem__(index))
+
+    def __iter__(self):
+        for row in super().__iter__():
+            yield self.as_dot_dict(row)
+
+    def __reversed__(self):
+        for row in super().__reversed__():
+            yield self.as_dot_dict(row)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def copy(self):
+        return list(self)
+
+
+class TestCaseDataDict(dict):
+    """Dictionary of the rows of a ``TestCaseDataList`` by their test case name.
+
+    Values are handed out as the same ``DotDict`` the list returns for that row.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows: TestCaseDataList):
+        super().__init__((row.test_case_name, row) for row in list.__iter__(rows))
+        self._rows = rows
+
+    def __getitem__(self, key):
+        return self._rows.as_dot_dict(super().__getitem__(key))
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __iter__(self):
+        return super().__iter__()
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def copy(self):
+        return dict(self.items())
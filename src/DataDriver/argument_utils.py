@@ -1,5 +1,8 @@
+import os
 import sys
+from copy import deepcopy
 from enum import IntEnum
+from functools import lru_cache
 
 from robot.libraries.BuiltIn import BuiltIn  # type: ignore
 from robot.run import USAGE  # type: ignore
@@ -15,12 +18,7 @@ class ArgumentState(IntEnum):
 
 
 def robot_options():
-    arg_parser = ArgumentParser(
-        USAGE,
-        auto_argumentfile=True,
-        env_options="ROBOT_OPTIONS",
-    )
-    cli_args = arg_parser.parse_args(filter_args(arg_parser))[0]
+    cli_args = deepcopy(_parse_robot_options(tuple(sys.argv), os.environ.get("ROBOT_OPTIONS")))
     try:
         options = BuiltIn().get_variable_value(name="${options}")
         if options is not None:
@@ -31,22 +29,42 @@ def robot_options():
     return cli_args
 
 
-def filter_args(arg_parser):
-    short_opts = arg_parser._short_opts
-    long_opts = arg_parser._long_opts
+@lru_cache(maxsize=8)
+def _parse_robot_options(argv, env_options):
+    """Parses the Robot Framework® options once per process and command line.
+
+    ``argv`` and ``env_options`` are the cache key, so that changes
+    of ``sys.argv`` or ``ROBOT_OPTIONS`` lead to parsing again.
+    """
+    arg_parser = ArgumentParser(
+        USAGE,
+        auto_argumentfile=True,
+        env_options="ROBOT_OPTIONS",
+    )
+    return arg_parser.parse_args(filter_args(arg_parser, argv))[0]
+
+
+def filter_args(arg_parser, argv=None):
+    short_opts = set(arg_parser._short_opts)
+    long_opts = set(arg_parser._long_opts)
+    param_opts = get_param_opts(long_opts)
     arg_state = ArgumentState.ANALYZE_NEXT
     valid_robot_args = []
-    for arg in sys.argv[1:]:
+    for arg in (sys.argv if argv is None else argv)[1:]:
         if arg_state == ArgumentState.ANALYZE_NEXT:
-            arg_state = get_argument_state(arg, short_opts, long_opts)
+            arg_state = get_argument_state(arg, short_opts, long_opts, param_opts)
         if arg_state >= ArgumentState.ONE_KNOWN:
             valid_robot_args.append(arg)
             arg_state -= 1
     return valid_robot_args
 
 
-def get_argument_state(arg, short_opts, long_opts):
-    param_opt = [l_opt[:-1] for l_opt in long_opts if l_opt[-1:] == "="]
+def get_param_opts(long_opts):
+    return {l_opt[:-1] for l_opt in long_opts if l_opt[-1:] == "="}
+
+
+def get_argument_state(arg, short_opts, long_opts, param_opts=None):
+    param_opt = get_param_opts(long_opts) if param_opts is None else param_opts
     arg_state = 0
     if is_short_option(arg):
         if arg[1] in SINGLE_ARG_CHARACTERS:
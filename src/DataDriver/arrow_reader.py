@@ -0,0 +1,132 @@
+# Copyright 2018-  René Rohner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Set
+
+from robot.utils import DotDict  # type: ignore
+
+from .AbstractReaderClass import AbstractReaderClass, ArgumentColumn
+
+try:
+    import pyarrow as pa  # type: ignore
+except ImportError as err:
+    raise ImportError(
+        """Requirement (pyarrow) for Parquet and Arrow support is not installed.
+    Use 'pip install -U robotframework-datadriver[ARROW]' to install Parquet and Arrow support."""
+    ) from err
+
+BATCH_SIZE = 64 * 1024
+
+
+class arrow_reader(AbstractReaderClass):
+    """Reads Arrow IPC files, which are memory-mapped and read column by column.
+
+    Only the columns of the test case name, the tags, the documentation and the arguments are converted.
+    Cells keep their types like ``int``, ``float``, ``bool`` or ``datetime``.
+    Empty cells become ``""``. List columns are used as list arguments ``@{...}``
+    and struct columns as dictionary arguments ``&{...}``.
+    """
+
+    def get_data_from_source(self):
+        self.data_table.extend(self.iter_data_from_source())
+        return self.data_table
+
+    def iter_data_from_source(self):
+        with pa.memory_map(str(self.file)) as source:
+            schema, batches = self._open_source(source)
+            columns = self._project_columns(schema)
+            for first_row_number, batch in batches(columns):
+                rows = zip(
+                    *(
+                        self._get_column_values(column_id, batch.column(column_name))
+                        for column_id, column_name in enumerate(columns)
+                    )
+                )
+                yield from self._iter_test_case_data_in_blocks(rows, first_row_number)
+
+    def _open_source(self, source):
+        """Returns the schema and a function that yields the record batches of the given columns
+        together with the number of their first row."""
+        try:
+            reader = pa.ipc.open_file(source)
+        except pa.ArrowInvalid:
+            source.seek(0)
+            return self._open_stream(source)
+
+        def batches(columns):
+            first_row_number = 1
+            for batch_index in range(reader.num_record_batches):
+                batch = reader.get_batch(batch_index).select(columns)
+                yield first_row_number, batch
+                first_row_number += batch.num_rows
+
+        return reader.schema, batches
+
+    @staticmethod
+    def _open_stream(source):
+        reader = pa.ipc.open_stream(source)
+
+        def batches(columns):
+            first_row_number = 1
+            for batch in reader:
+                yield first_row_number, batch.select(columns)
+                first_row_number += batch.num_rows
+
+        return reader.schema, batches
+
+    def _project_columns(self, schema) -> List[str]:
+        """Analyses the header and returns the names of the columns that are read."""
+        self._analyse_header(schema.names)
+        column_ids = sorted(
+            column_id
+            for column_id in (
+                self.test_case_column_id,
+                self.tags_column_id,
+                self.documentation_column_id,
+                *self.arguments_column_ids,
+            )
+            if column_id is not None
+        )
+        columns = [schema.names[column_id] for column_id in column_ids]
+        self._analyse_header(columns)
+        self.native_list_column_ids: Set[int] = set()
+        self.native_dict_column_ids: Set[int] = set()
+        for column_id, column_name in enumerate(columns):
+            column_type = schema.field(column_name).type
+            if pa.types.is_list(column_type) or pa.types.is_large_list(column_type):
+                self.native_list_column_ids.add(column_id)
+            elif pa.types.is_struct(column_type):
+                self.native_dict_column_ids.add(column_id)
+        return columns
+
+    def _get_column_values(self, column_id: int, column) -> List:
+        values = column.to_pylist()
+        if column_id == self.tags_column_id:
+            return [self._join_tags(value) for value in values]
+        if column_id in (self.test_case_column_id, self.documentation_column_id):
+            return ["" if value is None else str(value) for value in values]
+        return ["" if value is None else value for value in values]
+
+    def _join_tags(self, value) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, list):
+            return ",".join(str(tag) for tag in value if tag is not None)
+        return str(value)
+
+    def _convert_argument_column(self, argument_column: ArgumentColumn, values: List) -> List:
+        if argument_column.is_list and argument_column.column_id in self.native_list_column_ids:
+            return [list(value) if value else [] for value in values]
+        if argument_column.is_dict and argument_column.column_id in self.native_dict_column_ids:
+            return [DotDict(value) if value else DotDict() for value in values]
+        return super()._convert_argument_column(argument_column, values)
@@ -14,17 +14,87 @@
 
 
 import csv
+import mmap
+from importlib.util import find_spec
 from pathlib import Path
 
 from DataDriver.AbstractReaderClass import AbstractReaderClass
+from DataDriver.csv_row_index import CsvRowIndex, is_line_based_encoding
+from DataDriver.utils import debug
+
+ARROW_BLOCK_SIZE = 4 * 1024 * 1024
+ROW_INDEX_CACHE_VARIANT = "csv_row_index"
 
 
 class csv_reader(AbstractReaderClass):
     def get_data_from_source(self):
-        self._register_dialects()
-        self._read_file_to_data_table()
+        self.data_table.extend(self.iter_data_from_source())
         return self.data_table
 
+    def iter_data_from_source(self):
+        self._register_dialects()
+        if self.reads_indexed_rows():
+            yield from self._read_indexed_rows()
+        else:
+            yield from self._read_file_to_test_case_data()
+
+    def reads_indexed_rows(self):
+        return (
+            bool(self.reader_config.cache_dir)
+            and self.selected_test_names is not None
+            and is_line_based_encoding(self.csv_encoding)
+        )
+
+    def _read_indexed_rows(self):
+        row_index = self._get_row_index()
+        if row_index is None:
+            return
+        selected_row_ids = [
+            row_id
+            for row_id, (test_case_name, tags) in enumerate(
+                zip(row_index.test_case_names, row_index.tags)
+            )
+            if self._is_row_selected(test_case_name, self._split_tags(tags))
+        ]
+        debug(f"[ DataDriver ] Reading {len(selected_row_ids)} of {len(row_index)} rows by index.")
+        if not selected_row_ids:
+            return
+        with Path(self.file).open("rb") as binary_file, mmap.mmap(
+            binary_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            rows = row_index.iter_rows(data, self.csv_encoding, self.csv_dialect, selected_row_ids)
+            for row_id, row in rows:
+                try:
+                    test_case_data = self._create_test_case_data(row)
+                except Exception as e:
+                    e.row = row_id + 2
+                    raise e
+                yield test_case_data
+
+    def _get_row_index(self):
+        from DataDriver.parse_cache import ParseCache  # noqa: PLC0415
+
+        cache = ParseCache(self.reader_config.cache_dir, self.reader_config.cache_size)
+        cache_key = cache.get_key(self.reader_config, ROW_INDEX_CACHE_VARIANT)
+        row_index = cache.load(cache_key)
+        if row_index is not None:
+            self._analyse_header(row_index.header)
+            return row_index
+        row_index = CsvRowIndex.build(
+            self.file, self.csv_encoding, self.csv_dialect, self._analyse_index_header
+        )
+        cache.store(cache_key, row_index)
+        return row_index
+
+    def _analyse_index_header(self, header):
+        self._analyse_header(header)
+        return self.test_case_column_id, self.tags_column_id
+
+    def _split_tags(self, tags):
+        if not self.tags_column_id or tags is None:
+            return None
+        return [t.strip() for t in tags.split(",")]
+
     def _register_dialects(self):
         if self.csv_dialect.lower() == "userdefined":
             csv.register_dialect(
@@ -49,15 +119,105 @@ class csv_reader(AbstractReaderClass):
                 quoting=csv.QUOTE_ALL,
             )
 
-    def _read_file_to_data_table(self):
+    def _read_file_to_test_case_data(self):
+        rows = self._read_rows()
+        header = next(rows, None)
+        if header is None:
+            return
+        self._analyse_header(header)
+        yield from self._iter_test_case_data_in_blocks(rows, first_row_number=2)
+
+    def _read_rows(self):
+        engine = str(getattr(self, "csv_engine", "python")).lower()
+        if engine == "fast":
+            parse_options = self._get_arrow_parse_options()
+            if parse_options is not None:
+                return self._read_rows_with_arrow(parse_options)
+        elif engine != "python":
+            raise ValueError(f"csv_engine={engine} is not a valid value!")
+        return self._read_rows_with_csv()
+
+    def _read_rows_with_csv(self):
         with Path(self.file).open(encoding=self.csv_encoding) as csvfile:
-            reader = csv.reader(csvfile, self.csv_dialect)
-            for row_index, row in enumerate(reader):
-                try:
-                    if row_index == 0:
-                        self._analyse_header(row)
-                    else:
-                        self._read_data_from_table(row)
-                except Exception as e:
-                    e.row = row_index + 1
-                    raise e
+            yield from csv.reader(csvfile, self.csv_dialect)
+
+    def _get_arrow_parse_options(self):
+        """Returns the pyarrow ParseOptions of the dialect or None if pyarrow can not read it."""
+        if not find_spec("pyarrow"):
+            debug("[ DataDriver ] csv_engine=fast needs pyarrow. Reading with Python csv module.")
+            return None
+        dialect = csv.get_dialect(self.csv_dialect)
+        if (
+            len(dialect.delimiter) != 1
+            or dialect.skipinitialspace
+            or dialect.quoting == csv.QUOTE_NONNUMERIC
+        ):
+            debug(
+                f"[ DataDriver ] Dialect '{self.csv_dialect}' is not supported by csv_engine=fast. "
+                "Reading with Python csv module."
+            )
+            return None
+        from pyarrow import csv as arrow_csv  # type: ignore  # noqa: PLC0415
+
+        has_quotes = dialect.quoting != csv.QUOTE_NONE and bool(dialect.quotechar)
+        return arrow_csv.ParseOptions(
+            delimiter=dialect.delimiter,
+            quote_char=dialect.quotechar if has_quotes else False,
+            double_quote=dialect.doublequote,
+            escape_char=dialect.escapechar or False,
+            newlines_in_values=has_quotes or bool(dialect.escapechar),
+        )
+
+    def _read_rows_with_arrow(self, parse_options):
+        """Parses the file in blocks with multiple threads and yields the rows batch by batch.
+
+        All cells are read as strings. The header is read as first row,
+        so the column names of pyarrow are just placeholders.
+        Line breaks in quoted cells are translated to ``\\n`` like Python does in text mode.
+        """
+        import pyarrow as pa  # type: ignore  # noqa: PLC0415
+        import pyarrow.compute as pc  # type: ignore  # noqa: PLC0415
+        from pyarrow import csv as arrow_csv  # type: ignore  # noqa: PLC0415
+
+        header = next(self._read_rows_with_csv(), None)
+        if header is None:
+            return
+        column_names = [f"column_{index}" for index in range(len(header))]
+        try:
+            reader = arrow_csv.open_csv(
+                self.file,
+                read_options=arrow_csv.ReadOptions(
+                    column_names=column_names,
+                    encoding=self.csv_encoding,
+                    block_size=ARROW_BLOCK_SIZE,
+                ),
+                parse_options=parse_options,
+                convert_options=arrow_csv.ConvertOptions(
+                    column_types=dict.fromkeys(column_names, pa.string()),
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+        except pa.ArrowInvalid as e:
+            debug(f"[ DataDriver ] csv_engine=fast failed: {e}. Reading with Python csv module.")
+            yield from self._read_rows_with_csv()
+            return
+        try:
+            for batch in reader:
+                columns = batch.columns
+                if parse_options.newlines_in_values:
+                    columns = [self._translate_newlines(column, pc) for column in columns]
+                yield from zip(*(column.to_pylist() for column in columns))
+        except pa.ArrowInvalid as e:
+            raise ValueError(
+                f"csv_engine=fast could not read '{self.file}': {e}\n"
+                "Use csv_engine=python for this file."
+            ) from e
+        finally:
+            reader.close()
+
+    @staticmethod
+    def _translate_newlines(column, pc):
+        if not pc.any(pc.match_substring(column, "\r")).as_py():
+            return column
+        return pc.replace_substring(pc.replace_substring(column, "\r\n", "\n"), "\r", "\n")
@@ -0,0 +1,99 @@
+# Copyright 2018-  René Rohner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import csv
+import io
+import mmap
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+def is_line_based_encoding(encoding: str) -> bool:
+    """Returns True if lines of the encoding end with the byte ``\\n`` and can be decoded one by one."""
+    try:
+        return "row\n".encode(encoding).endswith(b"row\n")
+    except LookupError:
+        return False
+
+
+class CsvRowIndex:
+    """Byte offsets, test case names and tags of all data rows of a csv file.
+
+    The index is built with one pass over the file without converting any arguments.
+    Afterwards single rows can be read from the memory-mapped file by their offsets.
+    """
+
+    def __init__(self, header: List[str]):
+        self.header = header
+        self.test_case_names: List[str] = []
+        self.tags: List[Optional[str]] = []
+        self.offsets = array("q")
+
+    def __len__(self):
+        return len(self.test_case_names)
+
+    @classmethod
+    def build(
+        cls,
+        file: str,
+        encoding: str,
+        dialect: str,
+        analyse_header: Callable[[List[str]], Tuple[Optional[int], Optional[int]]],
+    ) -> Optional["CsvRowIndex"]:
+        """Reads the file once and indexes each row.
+
+        ``analyse_header`` gets the header row and returns the column ids
+        of the test case names and of the tags.
+        """
+        with Path(file).open("rb") as binary_file:
+            position = 0
+
+            def decoded_lines():
+                nonlocal position
+                for line in binary_file:
+                    position += len(line)
+                    yield line.decode(encoding)
+
+            reader = csv.reader(decoded_lines(), dialect)
+            header = next(reader, None)
+            if header is None:
+                return None
+            test_case_column_id, tags_column_id = analyse_header(header)
+            row_index = cls(header)
+            shared_tags: Dict[Optional[str], Optional[str]] = {}
+            row_start = position
+            for row in reader:
+                row_index.offsets.append(row_start)
+                row_index.test_case_names.append(_get_cell(row, test_case_column_id, ""))
+                tags = _get_cell(row, tags_column_id, None)
+                row_index.tags.append(shared_tags.setdefault(tags, tags))
+                row_start = position
+            row_index.offsets.append(row_start)
+        return row_index
+
+    def iter_rows(
+        self, data: Union[bytes, mmap.mmap], encoding: str, dialect: str, row_ids: Iterable[int]
+    ) -> Iterator[Tuple[int, List[str]]]:
+        """Yields the id and the cells of the given rows read from ``data``, the content of the file."""
+        for row_id in row_ids:
+            record = data[self.offsets[row_id] : self.offsets[row_id + 1]]
+            text = io.TextIOWrapper(io.BytesIO(record), encoding=encoding)
+            yield row_id, next(csv.reader(text, dialect), [])
+
+
+def _get_cell(row, column_id, default):
+    if column_id is None or column_id >= len(row):
+        return default
+    return row[column_id]
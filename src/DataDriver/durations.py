@@ -0,0 +1,51 @@
+# Copyright 2018-  René Rohner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from pathlib import Path
+from typing import Dict
+
+from robot.api import ExecutionResult, ResultVisitor  # type: ignore
+
+
+def read_test_durations(durations_file: str) -> Dict[str, float]:
+    """Reads the elapsed seconds per test from an ``output.xml`` or a JSON duration history.
+
+    The JSON file is a single object mapping test names to seconds,
+    like ``{"Suite.Test 1": 1.5, "Suite.Test 2": 0.25}``.
+    Tests from ``output.xml`` are stored with their long name and with ``<suite name>.<test name>``.
+    """
+    path = Path(durations_file)
+    if path.suffix.lower() == ".json":
+        with path.open(encoding="utf-8") as file:
+            return {str(name): float(seconds) for name, seconds in json.load(file).items()}
+    result = ExecutionResult(str(path))
+    durations_visitor = DataDriverDurationsVisitor()
+    result.visit(durations_visitor)
+    return durations_visitor.durations
+
+
+class DataDriverDurationsVisitor(ResultVisitor):
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+
+    def visit_test(self, test):
+        """Stores the elapsed seconds of the test without visiting its body."""
+        elapsed = getattr(test, "elapsed_time", None)
+        if elapsed is not None:
+            seconds = elapsed.total_seconds()
+        else:
+            seconds = test.elapsedtime / 1000  # robotframework<7.0
+        self.durations[test.longname] = seconds
+        self.durations.setdefault(f"{test.parent.name}.{test.name}", seconds)
@@ -21,10 +21,13 @@ from DataDriver.AbstractReaderClass import AbstractReaderClass
 
 class generic_csv_reader(AbstractReaderClass):
     def get_data_from_source(self):
-        self._register_dialects()
-        self._read_file_to_data_table()
+        self.data_table.extend(self.iter_data_from_source())
         return self.data_table
 
+    def iter_data_from_source(self):
+        self._register_dialects()
+        yield from self._read_file_to_test_case_data()
+
     def _register_dialects(self):
         if self.csv_dialect.lower() == "userdefined":
             csv.register_dialect(
@@ -49,14 +52,11 @@ class generic_csv_reader(AbstractReaderClass):
                 quoting=csv.QUOTE_ALL,
             )
 
-    def _read_file_to_data_table(self):
+    def _read_file_to_test_case_data(self):
         with Path(self.file).open(encoding=self.csv_encoding) as csvfile:
             reader = csv.reader(csvfile, self.csv_dialect)
-            for row_index, row in enumerate(reader):
-                if row_index == 0:
-                    row_of_variables = []
-                    for cell in row:
-                        row_of_variables.append(f"${{{cell.strip()}}}")
-                    self._analyse_header(row_of_variables)
-                else:
-                    self._read_data_from_table(row)
+            header = next(reader, None)
+            if header is None:
+                return
+            self._analyse_header([f"${{{cell.strip()}}}" for cell in header])
+            yield from self._iter_test_case_data_in_blocks(reader, first_row_number=2)
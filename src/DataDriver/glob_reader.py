@@ -23,6 +23,8 @@ from DataDriver.AbstractReaderClass import AbstractReaderClass
 
 
 class glob_reader(AbstractReaderClass):
+    supports_file_patterns = True
+
     def get_data_from_source(self):
         self._read_glob_to_data_table()
         return self.data_table
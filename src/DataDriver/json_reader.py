@@ -42,14 +42,98 @@
   }
 ]
 """
-from json import load
+
+import re
+from json import JSONDecodeError, JSONDecoder
+from json.decoder import WHITESPACE  # type: ignore
 from pathlib import Path
+from typing import Iterator, TextIO
 
 from .AbstractReaderClass import AbstractReaderClass
 from .ReaderConfig import TestCaseData
 
+CHUNK_SIZE = 1024 * 1024
+NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+
 
 class json_reader(AbstractReaderClass):
     def get_data_from_source(self):
+        return list(self.iter_data_from_source())
+
+    def iter_data_from_source(self):
         with Path(self.file).open(encoding="utf-8") as json_file:
-            return [TestCaseData(**test) for test in load(json_file)]
+            for test in iter_json_array(json_file):
+                if self._is_row_selected(test.get("test_case_name"), test.get("tags")):
+                    yield TestCaseData(**test)
+
+
+def iter_json_array(json_file: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """Parses a JSON array incrementally and yields its elements one by one.
+
+    Only the current chunk of the file and the element being decoded are kept in memory.
+    """
+    decoder = JSONDecoder()
+    buffer, position, eof = _skip_whitespace(json_file, "", 0, False, chunk_size)
+    if buffer[position : position + 1] != "[":
+        raise ValueError(f"{json_file.name} does not contain a JSON array.")
+    position += 1
+    has_elements = False
+    expects_element = False
+    while True:
+        buffer, position, eof = _skip_whitespace(json_file, buffer, position, eof, chunk_size)
+        next_char = buffer[position : position + 1]
+        if next_char == "]" and not expects_element:
+            buffer, position, eof = _skip_whitespace(
+                json_file, buffer, position + 1, eof, chunk_size
+            )
+            if position < len(buffer):
+                _raise_decode_error(json_file, buffer, position, "Extra data")
+            return
+        if has_elements and not expects_element:
+            if next_char != ",":
+                _raise_decode_error(json_file, buffer, position, "Expecting ',' delimiter")
+            expects_element = True
+            position += 1
+            continue
+        try:
+            element, end = decoder.raw_decode(buffer, position)
+        except JSONDecodeError:
+            if eof:
+                raise
+            buffer, position, eof = _read_next_chunk(json_file, buffer, position, chunk_size)
+            continue
+        if not eof and _may_continue(element, buffer, end):
+            buffer, position, eof = _read_next_chunk(json_file, buffer, position, chunk_size)
+            continue
+        yield element
+        position = end
+        has_elements = True
+        expects_element = False
+
+
+def _may_continue(element, buffer: str, end: int) -> bool:
+    """Tells if ``element`` is a number whose digits may continue in the next chunk."""
+    if end == len(buffer):
+        return True
+    return (
+        isinstance(element, (int, float))
+        and not isinstance(element, bool)
+        and NUMBER_TAIL.fullmatch(buffer, end) is not None
+    )
+
+
+def _skip_whitespace(json_file: TextIO, buffer: str, position: int, eof: bool, chunk_size: int):
+    position = WHITESPACE.match(buffer, position).end()
+    while position == len(buffer) and not eof:
+        buffer, position, eof = _read_next_chunk(json_file, buffer, position, chunk_size)
+        position = WHITESPACE.match(buffer, position).end()
+    return buffer, position, eof
+
+
+def _read_next_chunk(json_file: TextIO, buffer: str, position: int, chunk_size: int):
+    chunk = json_file.read(chunk_size)
+    return buffer[position:] + chunk, 0, not chunk
+
+
+def _raise_decode_error(json_file: TextIO, buffer: str, position: int, message: str):
+    raise JSONDecodeError(f"{message} in {json_file.name}", buffer, position)
@@ -0,0 +1,43 @@
+# Copyright 2018-  René Rohner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+{"test_case_name": "first", "arguments": {"${username}": "demo", "${password}": "mode"}, "tags": ["tag1", "smoke"], "documentation": "This is the doc"}
+{"test_case_name": "second", "arguments": {"${username}": "${EMPTY}", "${password}": "mode"}, "tags": ["tag1"]}
+"""
+
+from json import JSONDecodeError, loads
+from pathlib import Path
+
+from .AbstractReaderClass import AbstractReaderClass
+from .ReaderConfig import TestCaseData
+
+
+class jsonl_reader(AbstractReaderClass):
+    def get_data_from_source(self):
+        return list(self.iter_data_from_source())
+
+    def iter_data_from_source(self):
+        with Path(self.file).open(encoding="utf-8") as jsonl_file:
+            for line_number, line in enumerate(jsonl_file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    test = loads(line)
+                except JSONDecodeError as e:
+                    e.row = line_number
+                    raise e
+                if self._is_row_selected(test.get("test_case_name"), test.get("tags")):
+                    yield TestCaseData(**test)
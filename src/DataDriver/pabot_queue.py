@@ -0,0 +1,123 @@
+# Copyright 2018-  René Rohner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import math
+import statistics
+import time
+import xmlrpc.client
+from typing import Iterable, List, Optional
+
+from .utils import debug
+
+PABOT_QUEUE_BATCH_SIZE = 1000
+
+
+def add_to_pabot_queue(pabotlib, pabotlib_url: Optional[str], suite_name: str, queue_variables):
+    """Adds one execution of ``suite_name`` per queue variable to the pabot execution queue."""
+    start_time = time.perf_counter()
+    if pabotlib_url and _add_batches_to_pabot_queue(pabotlib_url, suite_name, queue_variables):
+        mode = "batches"
+    else:
+        _add_each_to_pabot_queue(pabotlib, suite_name, queue_variables)
+        mode = "single calls"
+    debug(
+        f"[ DataDriver ] {len(queue_variables)} items added to pabot queue in {mode} "
+        f"within {time.perf_counter() - start_time:.3f}s"
+    )
+
+
+def _add_each_to_pabot_queue(pabotlib, suite_name: str, queue_variables):
+    for queue_variable in queue_variables:
+        pabotlib.run_keyword("add_suite_to_execution_queue", [suite_name, [queue_variable]], {})
+
+
+def _add_batches_to_pabot_queue(pabotlib_url: str, suite_name: str, queue_variables) -> bool:
+    """Adds the items with XML-RPC ``system.multicall`` in batches.
+
+    Returns False without adding anything, if PabotLib does not list ``system.multicall``
+    in ``system.listMethods``.
+    """
+    if "://" not in pabotlib_url:
+        pabotlib_url = f"http://{pabotlib_url}"
+    server = xmlrpc.client.ServerProxy(pabotlib_url, allow_none=True)
+    try:
+        supports_multicall = "system.multicall" in server.system.listMethods()
+    except (xmlrpc.client.Error, OSError) as e:
+        debug(f"[ DataDriver ] PabotLib methods could not be listed: {e}")
+        supports_multicall = False
+    if not supports_multicall:
+        debug("[ DataDriver ] PabotLib does not support batches.")
+        return False
+    for batch_start in range(0, len(queue_variables), PABOT_QUEUE_BATCH_SIZE):
+        multicall = xmlrpc.client.MultiCall(server)
+        for queue_variable in queue_variables[batch_start : batch_start + PABOT_QUEUE_BATCH_SIZE]:
+            multicall.run_keyword("add_suite_to_execution_queue", [suite_name, [queue_variable]])
+        try:
+            results = list(multicall())
+        except (xmlrpc.client.Error, OSError) as e:
+            raise RuntimeError(f"Adding tests to pabot queue failed: {e}") from e
+        for result in results:
+            if result.get("status") != "PASS":
+                raise RuntimeError(result.get("error", "Adding tests to pabot queue failed"))
+    return True
+
+
+def encode_row_ranges(row_indices: Iterable[int]) -> str:
+    """Encodes row indices as ranges like ``0-499,730-760,800``."""
+    ranges: List[List[int]] = []
+    for index in sorted(row_indices):
+        if ranges and index == ranges[-1][1] + 1:
+            ranges[-1][1] = index
+        else:
+            ranges.append([index, index])
+    return ",".join(f"{start}-{end}" if start != end else str(start) for start, end in ranges)
+
+
+def weighted_partition_test_list(
+    test_list: List, weights: List[Optional[float]], process_count: int
+):
+    """Longest processing time first: assigns the heaviest test to the lightest group.
+
+    Tests with unknown weight (``None``) get the median of the known weights.
+    Each group keeps the original order of its tests.
+    """
+    known_weights = [weight for weight in weights if weight is not None]
+    default_weight = statistics.median(known_weights) if known_weights else 1.0
+    weights = [default_weight if weight is None else weight for weight in weights]
+    groups: List[List[int]] = [[] for _ in range(process_count)]
+    loads = [(0.0, group_id) for group_id in range(process_count)]
+    for test_id in sorted(range(len(test_list)), key=lambda i: weights[i], reverse=True):
+        load, group_id = heapq.heappop(loads)
+        groups[group_id].append(test_id)
+        heapq.heappush(loads, (load + weights[test_id], group_id))
+    return [[test_list[test_id] for test_id in sorted(group)] for group in groups if group]
+
+
+def guided_partition_test_list(
+    test_list: List, process_count: int, min_chunk_size: int = 1, factor: int = 2
+):
+    """Guided self-scheduling: each group gets ``remaining / (factor * process_count)`` tests.
+
+    Groups get smaller towards the end of the queue, but never smaller than ``min_chunk_size``.
+    """
+    min_chunk_size = max(1, int(min_chunk_size))
+    chunks = []
+    start = 0
+    while start < len(test_list):
+        remaining = len(test_list) - start
+        chunk_size = max(min_chunk_size, math.ceil(remaining / (factor * process_count)))
+        chunks.append(test_list[start : start + chunk_size])
+        start += chunk_size
+    return chunks
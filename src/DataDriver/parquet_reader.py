@@ -0,0 +1,90 @@
+# Copyright 2018-  René Rohner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Optional
+
+from .arrow_reader import BATCH_SIZE, arrow_reader
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError as err:
+    raise ImportError(
+        """Requirement (pyarrow) for Parquet and Arrow support is not installed.
+    Use 'pip install -U robotframework-datadriver[ARROW]' to install Parquet and Arrow support."""
+    ) from err
+
+
+class parquet_reader(arrow_reader):
+    """Reads Parquet files like ``arrow_reader`` reads Arrow IPC files.
+
+    If only some tests are selected by name, like with ``rerunfailed`` or pabot,
+    row groups whose test case name statistics contain none of these names are not read.
+    This is only done if the test case name column is a string column.
+    Only their tags are read to keep the tags of all skipped rows.
+    """
+
+    def _open_source(self, source):
+        parquet_file = pq.ParquetFile(source)
+
+        def batches(columns):
+            row_group_start = 1
+            for row_group in range(parquet_file.num_row_groups):
+                row_group_rows = parquet_file.metadata.row_group(row_group).num_rows
+                if self._is_row_group_pruned(parquet_file, row_group, columns):
+                    self._prune_row_group(parquet_file, row_group, columns, row_group_rows)
+                else:
+                    first_row_number = row_group_start
+                    for batch in parquet_file.iter_batches(
+                        batch_size=BATCH_SIZE, row_groups=[row_group], columns=columns
+                    ):
+                        yield first_row_number, batch
+                        first_row_number += batch.num_rows
+                row_group_start += row_group_rows
+
+        return parquet_file.schema_arrow, batches
+
+    def _is_row_group_pruned(self, parquet_file, row_group: int, columns) -> bool:
+        if self.selected_test_names is None or self.test_case_column_id is None:
+            return False
+        column_name = columns[self.test_case_column_id]
+        column_type = parquet_file.schema_arrow.field(column_name).type
+        if not (pa.types.is_string(column_type) or pa.types.is_large_string(column_type)):
+            return False  # min and max of other types do not sort like the names
+        statistics = self._get_statistics(parquet_file, row_group, column_name)
+        if statistics is None or not statistics.has_min_max or statistics.null_count:
+            return False
+        if not statistics.min:  # rows without test case name are never skipped by name
+            return False
+        return not any(
+            statistics.min <= name <= statistics.max for name in self.selected_test_names
+        )
+
+    @staticmethod
+    def _get_statistics(parquet_file, row_group: int, column_name: str) -> Optional[object]:
+        row_group_metadata = parquet_file.metadata.row_group(row_group)
+        for column_index in range(row_group_metadata.num_columns):
+            column = row_group_metadata.column(column_index)
+            if column.path_in_schema == column_name:
+                return column.statistics
+        return None
+
+    def _prune_row_group(self, parquet_file, row_group: int, columns, row_group_rows: int):
+        self.pruned_rows += row_group_rows
+        if not self.tags_column_id:
+            return
+        tags_column = parquet_file.read_row_group(
+            row_group, columns=[columns[self.tags_column_id]]
+        ).column(0)
+        for tags in self._get_column_values(self.tags_column_id, tags_column):
+            self.pruned_tags.update(tag.strip() for tag in tags.split(","))
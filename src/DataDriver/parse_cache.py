@@ -0,0 +1,152 @@
+# Copyright 2018-  René Rohner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import inspect
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from .DataDriver import __version__
+from .ReaderConfig import ReaderConfig
+from .utils import debug
+
+CACHE_FORMAT_VERSION = 2
+CACHE_FILE_SUFFIX = ".ddcache"
+CACHED_CONFIG_FIELDS = (
+    "encoding",
+    "dialect",
+    "delimiter",
+    "quotechar",
+    "escapechar",
+    "doublequote",
+    "skipinitialspace",
+    "lineterminator",
+    "sheet_name",
+    "reader_class",
+    "list_separator",
+)
+
+
+class ParseCache:
+    """Stores parsed data tables as pickle files in a size bounded directory.
+
+    Entries are keyed by the resolved data file, its mtime and size, the
+    reader relevant parts of the ``ReaderConfig``, the DataDriver version and the
+    source file and mtime of the reader module.
+    An additional ``variant`` distinguishes entries derived from the same data file,
+    like the test case chunks a pabot ``--testlevelsplit`` queue hands to its workers.
+    If the directory grows above ``max_size_mb`` the least recently used entries are removed.
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: int = 512):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = int(max_size_mb) * 1024 * 1024
+
+    def get_key(self, reader_config: ReaderConfig, variant: str = "") -> Optional[str]:
+        if not reader_config.file:
+            return None
+        file = Path(reader_config.file)
+        if not file.is_file():
+            return None
+        file = file.resolve()
+        stat = file.stat()
+        config = [
+            (field, self._config_value(getattr(reader_config, field)))
+            for field in CACHED_CONFIG_FIELDS
+        ]
+        config.extend(sorted((key, repr(value)) for key, value in reader_config.kwargs.items()))
+        key_source = repr(
+            (
+                CACHE_FORMAT_VERSION,
+                __version__,
+                self._reader_source(reader_config.reader_class),
+                str(file),
+                stat.st_mtime_ns,
+                stat.st_size,
+                config,
+                variant,
+            )
+        )
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _reader_source(reader_class) -> Tuple[str, int]:
+        if not inspect.isclass(reader_class):
+            return "", 0
+        try:
+            source = Path(inspect.getfile(reader_class)).resolve()
+            return str(source), source.stat().st_mtime_ns
+        except (TypeError, OSError):
+            return "", 0
+
+    @staticmethod
+    def _config_value(value):
+        if inspect.isclass(value):
+            return f"{value.__module__}.{value.__qualname__}"
+        return repr(value)
+
+    def load(self, key: Optional[str]) -> Any:
+        if key is None:
+            return None
+        cache_file = self._cache_file(key)
+        try:
+            with cache_file.open("rb") as file:
+                data_table = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            debug(f"[ DataDriver ] Ignoring broken cache file '{cache_file}': {e}")
+            return None
+        os.utime(cache_file)
+        debug(f"[ DataDriver ] Data table loaded from cache file '{cache_file}'")
+        return data_table
+
+    def store(self, key: Optional[str], data_table: Any, evict: bool = True) -> None:
+        if key is None:
+            return
+        cache_file = self._cache_file(key)
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with temp_file.open("wb") as file:
+                pickle.dump(data_table, file, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_file.replace(cache_file)
+        except Exception as e:
+            debug(f"[ DataDriver ] Data table could not be cached: {e}")
+            temp_file.unlink(missing_ok=True)
+            return
+        debug(f"[ DataDriver ] Data table stored to cache file '{cache_file}'")
+        if evict:
+            self.evict()
+
+    def _cache_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def evict(self) -> None:
+        entries = []
+        for cache_file in self.cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = cache_file.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, cache_file))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, cache_file in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+            cache_file.unlink(missing_ok=True)
+            total_size -= size
+            debug(f"[ DataDriver ] Removed cache file '{cache_file}'")
@@ -0,0 +1,101 @@
+# Copyright 2018-  René Rohner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class SuiteStats:
+    """Wall time per phase and row counts of the start of one data-driven suite.
+
+    After ``start_memory_trace`` the peak of the memory allocated by Python is measured with ``tracemalloc``.
+    """
+
+    def __init__(self, suite_name: str):
+        self.suite_name = suite_name
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.trace_memory = False
+        self._traces_memory = False
+        self._start_time = time.perf_counter()
+
+    def start_memory_trace(self):
+        import tracemalloc  # noqa: PLC0415
+
+        self.trace_memory = True
+        self._traces_memory = not tracemalloc.is_tracing()
+        if self._traces_memory:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):  # Python >= 3.9
+            tracemalloc.reset_peak()
+
+    @contextmanager
+    def phase(self, name: str):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start_time)
+
+    def add_time(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count(self, name: str, value: int):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def finish(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "suite": self.suite_name,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "total": round(time.perf_counter() - self._start_time, 6),
+            "phases": {name: round(seconds, 6) for name, seconds in self.phases.items()},
+            **self.counters,
+        }
+        if self.trace_memory:
+            import tracemalloc  # noqa: PLC0415
+
+            stats["memory_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 3)
+        self.stop()
+        return stats
+
+    def stop(self):
+        """Stops the memory trace if these stats started it. Safe to call more than once."""
+        if self._traces_memory:
+            import tracemalloc  # noqa: PLC0415
+
+            tracemalloc.stop()
+            self._traces_memory = False
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    phases = ", ".join(f"{name}={seconds:.3f}s" for name, seconds in stats["phases"].items())
+    counters = ", ".join(
+        f"{name}={value}"
+        for name, value in stats.items()
+        if name not in ("suite", "timestamp", "total", "phases")
+    )
+    return f"total={stats['total']:.3f}s, {phases}, {counters}"
+
+
+def append_stats(stats_file: Optional[str], stats: Dict[str, Any]):
+    if not stats_file:
+        return
+    path = Path(stats_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as file:
+        file.write(json.dumps(stats) + "\n")
@@ -1,10 +1,13 @@
+import hashlib
 import math
 import re
 from enum import Enum, auto
-from typing import Any, List
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from robot.api import logger  # type: ignore
 from robot.libraries.BuiltIn import BuiltIn  # type: ignore
+from robot.model.tags import TagPatterns, Tags  # type: ignore
 
 from .argument_utils import is_pabot_testlevelsplit
 
@@ -143,6 +146,8 @@ class PabotOpt(Enum):
     - Equal: means it creates equal sizes groups
     - Binary: is more complex. it created a decreasing size of containers to support better balancing.
     - Atomic: it does not group tests at all and runs really each test case in a separate thread.
+    - Weighted: creates groups of nearly same duration, based on the durations of a previous execution.
+    - Guided: creates decreasing groups, each of a size of the remaining tests divided by twice the processes.
 
     See `Pabot and DataDriver <#pabot-and-datadriver>`__ for more details.
 
@@ -152,6 +157,8 @@ class PabotOpt(Enum):
     Equal = auto()
     Binary = auto()
     Atomic = auto()
+    Weighted = auto()
+    Guided = auto()
 
 
 class TagHandling(Enum):
@@ -171,6 +178,54 @@ class TagHandling(Enum):
     NoTags = auto()
 
 
+TAG_FILTER_CACHE_SIZE = 10000
+
+
+class TagFilter:
+    """Include and exclude tag patterns compiled once per suite.
+
+    The tags of a data row are combined with the tags of the template test
+    like they are for the generated test. Results are cached per tag combination.
+    """
+
+    def __init__(
+        self,
+        include: Any = None,
+        exclude: Any = None,
+        template_tags: Iterable[str] = (),
+        handle_template_tags: TagHandling = TagHandling.UnsetTags,
+    ):
+        self.include = TagPatterns(include) if include else None
+        self.exclude = TagPatterns(exclude) if exclude else None
+        self.template_tags = list(template_tags)
+        self.handle_template_tags = handle_template_tags
+        self._results: Dict[Tuple[str, ...], bool] = {}
+
+    @property
+    def is_active(self) -> bool:
+        return self.include is not None or self.exclude is not None
+
+    def match(self, tags: Optional[List[str]]) -> bool:
+        if not self.is_active or not isinstance(tags, list):
+            return True
+        key = tuple(tags)
+        if key in self._results:
+            return self._results[key]
+        result = self._match(tags)
+        if len(self._results) < TAG_FILTER_CACHE_SIZE:
+            self._results[key] = result
+        return result
+
+    def _match(self, tags: List[str]) -> bool:
+        if self.handle_template_tags != TagHandling.DefaultTags or len(tags) == 0:
+            all_tags = Tags([*self.template_tags, *tags])
+        else:
+            all_tags = Tags(tags)
+        if self.include is not None and not self.include.match(all_tags):
+            return False
+        return self.exclude is None or not self.exclude.match(all_tags)
+
+
 def debug(msg: Any, newline: bool = True, stream: str = "stdout"):
     if get_variable_value("${LOG LEVEL}") in ["DEBUG", "TRACE"]:
         logger.console(msg, newline, stream)
@@ -188,20 +243,51 @@ def error(msg: Any, html: bool = False):
     logger.error(msg, html)
 
 
-def get_filter_dynamic_test_names():
+def get_filter_dynamic_test_names() -> Optional[Set[str]]:
     dynamic_test_list = get_variable_value("${DYNAMICTESTS}")
     if isinstance(dynamic_test_list, str):
         test_names_esc = re.split(r"(?<!\\)(?:\\\\)*\|", dynamic_test_list)
-        return [name.replace("\\|", "|").replace("\\\\", "\\") for name in test_names_esc]
-    if isinstance(dynamic_test_list, list):
-        return dynamic_test_list
+        return {name.replace("\\|", "|").replace("\\\\", "\\") for name in test_names_esc}
+    if isinstance(dynamic_test_list, (list, tuple, set)):
+        return set(dynamic_test_list)
     dynamic_test_name = get_variable_value("${DYNAMICTEST}")
     if dynamic_test_name:
         BuiltIn().set_suite_metadata("DataDriver", dynamic_test_name, True)
-        return [dynamic_test_name]
+        return {dynamic_test_name}
+    return None
+
+
+def get_pabot_queue_variable() -> Optional[str]:
+    """Returns the variable the pabot queue has handed to this worker as ``NAME:value``."""
+    for name in ("DATADRIVER_ROWS", "DYNAMICTESTS", "DYNAMICTEST"):
+        value = get_variable_value(f"${{{name}}}")
+        if isinstance(value, str) and value:
+            return f"{name}:{value}"
     return None
 
 
+def is_file_pattern(file: Optional[str]) -> bool:
+    """Returns True if ``file`` is a glob pattern and not the path of an existing file."""
+    return bool(file) and bool(re.search(r"[*?[]", str(file))) and not Path(file).is_file()
+
+
+def file_content_hash(file: str) -> str:
+    content_hash = hashlib.sha256()
+    with Path(file).open("rb") as data_file:
+        for block in iter(lambda: data_file.read(1024 * 1024), b""):
+            content_hash.update(block)
+    return content_hash.hexdigest()[:16]
+
+
+def decode_row_ranges(row_ranges: str) -> Set[int]:
+    row_indices: Set[int] = set()
+    for row_range in row_ranges.split(","):
+        if row_range:
+            start, _, end = row_range.partition("-")
+            row_indices.update(range(int(start), int(end or start) + 1))
+    return row_indices
+
+
 def is_pabot_dry_run():
     return is_pabot_testlevelsplit() and get_variable_value("${PABOTQUEUEINDEX}") == "-1"
 
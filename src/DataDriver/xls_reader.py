@@ -11,11 +11,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from .xlsx_reader import nan, pd, xlsx_reader
+from .xlsx_reader import import_pandas, nan, xlsx_reader
 
 
 class xls_reader(xlsx_reader):
+    def _get_sheet_names(self, file):
+        pd = import_pandas()
+        with pd.ExcelFile(file) as excel_file:
+            return excel_file.sheet_names
+
+    def _read_rows(self, preserve_xls_types):
+        return self._read_rows_from_data_frame(preserve_xls_types)
+
     def read_data_frame_from_file(self, dtype):
+        pd = import_pandas()
         return pd.read_excel(self.file, sheet_name=self.sheet_name, dtype=dtype).replace(
             nan, "", regex=True
         )
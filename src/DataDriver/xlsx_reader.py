@@ -11,35 +11,190 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-try:
-    from math import nan  # type: ignore
+import copy
+import os
+from glob import glob
+from importlib.util import find_spec
+from math import nan
+from pathlib import Path
+from typing import List, Optional, Tuple
 
-    import openpyxl  # type: ignore  # noqa: F401
-    import pandas as pd  # type: ignore
-except ImportError as err:
-    raise ImportError(
-        """Requirements (pandas, openpyxl) for XLSX support are not installed.
-    Use 'pip install -U robotframework-datadriver[XLS]' to install XLSX support."""
-    ) from err
 from robot.utils import is_truthy  # type: ignore
 
 from .AbstractReaderClass import AbstractReaderClass
+from .ReaderConfig import ReaderConfig
+from .utils import is_file_pattern
+
+try:
+    import openpyxl  # type: ignore
+    from openpyxl.cell.cell import ERROR_CODES  # type: ignore
+except ImportError as err:
+    raise ImportError("""Requirement (openpyxl) for XLSX support is not installed.
+    Use 'pip install -U robotframework-datadriver[XLSX]' to install XLSX support.""") from err
 
 
 class xlsx_reader(AbstractReaderClass):
+    supports_file_patterns = True
+
     def get_data_from_source(self):
-        dtype = object if is_truthy(getattr(self, "preserve_xls_types", False)) else str
-        data_frame = self.read_data_frame_from_file(dtype)
-        self._analyse_header(list(data_frame))
-        for row_index, row in enumerate(data_frame.values.tolist()):
-            try:
-                self._read_data_from_table(row)
-            except Exception as e:
-                e.row = row_index + 1
-                raise e
+        self.data_table.extend(self.iter_data_from_source())
         return self.data_table
 
+    def iter_data_from_source(self):
+        preserve_xls_types = is_truthy(getattr(self, "preserve_xls_types", False))
+        sources = self._get_sources()
+        if sources is None:
+            yield from self._iter_test_case_data_of_source(self._read_rows(preserve_xls_types))
+            return
+        tag_files = is_file_pattern(self.file)
+        tag_sheets = self._reads_many_sheets()
+        try:
+            for (file, sheet_name), rows in zip(
+                sources, self._read_sources(sources, preserve_xls_types)
+            ):
+                self.source_tags = []
+                if tag_files:
+                    self.source_tags.append(f"source:{Path(file).name}")
+                if tag_sheets:
+                    self.source_tags.append(f"sheet:{sheet_name}")
+                yield from self._iter_test_case_data_of_source(iter(rows))
+        finally:
+            self.source_tags = []
+
+    def _iter_test_case_data_of_source(self, rows):
+        header = next(rows, None)
+        if header is None:
+            return
+        self._analyse_header([str(cell) for cell in header])
+        yield from self._iter_test_case_data_in_blocks(rows, first_row_number=1)
+
+    def _reads_many_sheets(self) -> bool:
+        return self.sheet_name == "*" or isinstance(self.sheet_name, (list, tuple))
+
+    def _get_sources(self) -> Optional[List[Tuple[str, object]]]:
+        """Returns the ``(file, sheet_name)`` pairs to read or None if just one sheet of one file is read.
+
+        ``file`` may be a glob pattern and ``sheet_name`` may be a list of sheets or ``*`` for all sheets.
+        """
+        file_pattern = is_file_pattern(self.file)
+        if not file_pattern and not self._reads_many_sheets():
+            return None
+        files = sorted(glob(self.file)) if file_pattern else [self.file]
+        sources = []
+        for file in files:
+            if self.sheet_name == "*":
+                sheet_names = self._get_sheet_names(file)
+            elif self._reads_many_sheets():
+                sheet_names = list(self.sheet_name)
+            else:
+                sheet_names = [self.sheet_name]
+            sources.extend((file, sheet_name) for sheet_name in sheet_names)
+        return sources
+
+    def _get_sheet_names(self, file) -> List[str]:
+        workbook = openpyxl.load_workbook(file, read_only=True)
+        try:
+            return workbook.sheetnames
+        finally:
+            workbook.close()
+
+    def _read_sources(self, sources, preserve_xls_types):
+        """Reads the rows of all sources in a process pool, because parsing is CPU-bound.
+
+        ``reader_processes`` limits the number of processes. By default one process per CPU is used.
+        With ``reader_processes=1`` the sources are read one after the other without a pool.
+        """
+        processes = int(getattr(self, "reader_processes", 0) or os.cpu_count() or 1)
+        if processes < 1:
+            raise ValueError(f"reader_processes={processes} is not a valid value!")
+        processes = min(processes, len(sources))
+        arguments = [
+            (type(self), self.reader_config, file, sheet_name, preserve_xls_types)
+            for file, sheet_name in sources
+        ]
+        if processes == 1:
+            yield from (read_source_rows(*argument) for argument in arguments)
+            return
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            yield from executor.map(read_source_rows, *zip(*arguments))
+
+    def _read_rows(self, preserve_xls_types):
+        engine = str(getattr(self, "xlsx_engine", "auto")).lower()
+        if engine == "auto":
+            engine = "pandas" if find_spec("pandas") else "openpyxl"
+        if engine == "pandas":
+            return self._read_rows_from_data_frame(preserve_xls_types)
+        if engine == "openpyxl":
+            return self._read_rows_from_workbook(preserve_xls_types)
+        raise ValueError(f"xlsx_engine={engine} is not a valid value!")
+
+    def _read_rows_from_workbook(self, preserve_xls_types):
+        workbook = openpyxl.load_workbook(self.file, read_only=True, data_only=True)
+        try:
+            sheet = self._get_sheet(workbook)
+            sheet.reset_dimensions()
+            header_width = None
+            for row in sheet.iter_rows(values_only=True):
+                cells = [self._convert_cell(value, preserve_xls_types) for value in row]
+                while cells and cells[-1] == "":
+                    cells.pop()
+                if not cells:
+                    continue
+                if header_width is None:
+                    header_width = len(cells)
+                elif len(cells) < header_width:
+                    cells.extend([""] * (header_width - len(cells)))
+                yield cells
+        finally:
+            workbook.close()
+
+    def _get_sheet(self, workbook):
+        if isinstance(self.sheet_name, int):
+            return workbook.worksheets[self.sheet_name]
+        return workbook[self.sheet_name]
+
+    @staticmethod
+    def _convert_cell(value, preserve_xls_types):
+        if value is None or (isinstance(value, str) and value in ERROR_CODES):
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return value if preserve_xls_types else str(value)
+
+    def _read_rows_from_data_frame(self, preserve_xls_types):
+        data_frame = self.read_data_frame_from_file(object if preserve_xls_types else str)
+        yield list(data_frame)
+        yield from zip(*(column.tolist() for _, column in data_frame.items()))
+
     def read_data_frame_from_file(self, dtype):
+        pd = import_pandas()
         return pd.read_excel(
             self.file, sheet_name=self.sheet_name, dtype=dtype, engine="openpyxl", na_filter=False
         ).replace(nan, "", regex=True)
+
+
+def read_source_rows(
+    reader_class, reader_config: ReaderConfig, file: str, sheet_name, preserve_xls_types: bool
+) -> list:
+    """Reads the raw rows of one sheet of one file. Runs in the worker processes of the pool.
+
+    Arguments are not converted here, because their variables are replaced by Robot Framework
+    and that is only running in the main process.
+    """
+    source_config = copy.copy(reader_config)
+    source_config.file = file
+    source_config.sheet_name = sheet_name
+    return list(reader_class(source_config)._read_rows(preserve_xls_types))
+
+
+def import_pandas():
+    try:
+        import pandas as pd  # type: ignore  # noqa: PLC0415
+    except ImportError as err:
+        raise ImportError(
+            """Requirement (pandas) for XLS support or 'xlsx_engine=pandas' is not installed.
+    Use 'pip install -U robotframework-datadriver[XLS]' to install XLS support."""
+        ) from err
+    return pd